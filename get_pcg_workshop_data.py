@@ -1,20 +1,39 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
 
-def fetch_and_parse_pcg_papers():
+# Accordion sections of a paper entry: (output field, div class, label prefix to strip)
+SECTION_PREFIXES = (
+    ('abstract', 'abstract', re.compile(r'^\s*Abstract\s*', re.IGNORECASE)),
+    ('keywords', 'keywords', re.compile(r'^\s*Keywords\s*', re.IGNORECASE)),
+    ('citation', 'bibtex', re.compile(r'^\s*Citation\s*', re.IGNORECASE)),
+)
+
+def create_session():
+    """Create an HTTP session that reuses connections and accepts compressed responses."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    return session
+
+def fetch_and_parse_pcg_papers(session=None):
     """Fetch PCG workshop database and parse all papers."""
 
     url = "https://www.pcgworkshop.com/database.php"
 
-    # Fetch the page
-    response = requests.get(url)
+    # Fetch the page (pass a session to share connections across several fetches)
+    if session is None:
+        session = create_session()
+    response = session.get(url, timeout=10)
     response.encoding = 'utf-8'
     html_content = response.text
 
-    # Parse with BeautifulSoup
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Parse with BeautifulSoup, only building the paper entries instead of the whole page
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer('div', class_='document'))
 
     papers = []
 
@@ -34,33 +53,12 @@ def fetch_and_parse_pcg_papers():
         authors_elem = doc.find('h4', class_='authors')
         authors = authors_elem.get_text().strip() if authors_elem else None
 
-        # Extract abstract (inside document-accordion)
-        abstract = None
-        abstract_div = doc.find('div', class_='abstract')
-        if abstract_div:
-            # Remove the "Abstract" label and get just the text
-            abstract_text = abstract_div.get_text()
-            # Remove "Abstract" prefix if present
-            abstract_text = re.sub(r'^\s*Abstract\s*', '', abstract_text, flags=re.IGNORECASE)
-            abstract = abstract_text.strip()
-
-        # Extract keywords
-        keywords = None
-        keywords_div = doc.find('div', class_='keywords')
-        if keywords_div:
-            keywords_text = keywords_div.get_text()
-            # Remove "Keywords" prefix if present
-            keywords_text = re.sub(r'^\s*Keywords\s*', '', keywords_text, flags=re.IGNORECASE)
-            keywords = keywords_text.strip()
-
-        # Extract citation/bibtex
-        bibtex = None
-        bibtex_div = doc.find('div', class_='bibtex')
-        if bibtex_div:
-            bibtex_text = bibtex_div.get_text()
-            # Remove "Citation" prefix if present
-            bibtex_text = re.sub(r'^\s*Citation\s*', '', bibtex_text, flags=re.IGNORECASE)
-            bibtex = bibtex_text.strip()
+        # Extract abstract, keywords and citation/bibtex (inside document-accordion),
+        # removing the section label prefix if present
+        sections = {}
+        for field, css_class, prefix in SECTION_PREFIXES:
+            section_div = doc.find('div', class_=css_class)
+            sections[field] = prefix.sub('', section_div.get_text()).strip() if section_div else None
 
         # Only add if we have at least title and year
         if title and year:
@@ -68,9 +66,9 @@ def fetch_and_parse_pcg_papers():
                 'title': title,
                 'year': year,
                 'authors': authors,
-                'abstract': abstract,
-                'keywords': keywords,
-                'citation': bibtex
+                'abstract': sections['abstract'],
+                'keywords': sections['keywords'],
+                'citation': sections['citation']
             }
             papers.append(paper_data)
 
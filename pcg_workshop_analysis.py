@@ -6,20 +6,58 @@ Simple analysis for PCG workshop papers: extract titles and abstracts from
 scores, and save CSV summaries and plots to `plots/`.
 
 This is intentionally lightweight: it uses scikit-learn's
-TfidfVectorizer with english stopwords to produce ranked term lists.
+CountVectorizer and TfidfTransformer with english stopwords to produce
+ranked term lists.
 """
 
 import json
 import os
 import re
 from collections import Counter
+from functools import lru_cache
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-import survey_analyzer
+try:
+	import ahocorasick
+except ImportError:
+	ahocorasick = None
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import ijson
+except ImportError:
+	ijson = None
+
+
+# Vector output settings on top of the survey style set by survey_analyzer:
+# maximum zlib level for PDF streams, embedded TrueType (Type 42) fonts
+# instead of Type 3 glyph procedures, and coarser path simplification.
+PLOT_RC_PARAMS = {
+	'path.simplify': True,
+	'path.simplify_threshold': 1.0,
+	'pdf.compression': 9,
+	'pdf.fonttype': 42,
+}
+
+
+@lru_cache(maxsize=None)
+def load_pyplot():
+	"""Import matplotlib.pyplot styled for the survey plots.
+
+	matplotlib and survey_analyzer (which sets the survey rcParams) are only
+	imported by the first plot, so runs that just write CSV and LaTeX tables
+	never load them.
+	"""
+	import matplotlib.pyplot as plt
+	import survey_analyzer  # noqa: F401 -- applies the survey rcParams
+	plt.rcParams.update(PLOT_RC_PARAMS)
+	return plt
 
 
 PAPERS_PATH = 'pcg_workshop_papers_filtered.json'
@@ -36,6 +74,19 @@ ONLY_COMPARISON = False
 # Output filename for the final comparison PDF (placed in top-level `plots/`)
 FINAL_COMPARISON_PDF = 'c3_pcgw_theme_comparison.pdf'
 
+# File format of the term bar plots in plots/pcgw. 'png' renders through
+# matplotlib; set it to 'svg' to write the bars directly without matplotlib.
+BARPLOT_FORMAT = 'png'
+
+# When True, plots that are newer than their inputs (the papers/survey JSON,
+# this script with its style constants, and survey_analyzer.py with the survey
+# rcParams) are not rendered again. The analysis, CSVs and tables are always
+# produced; only the figure rendering is skipped. Off by default so every run
+# renders every plot.
+SKIP_UP_TO_DATE_PLOTS = False
+
+SURVEY_PATH = 'procedural-level-generation-survey.json'
+
 # Module-level runtime switches. Instead of relying on command-line arguments,
 # toggle these booleans in the file when running from an editor/IDE. This makes
 # it easy to control which stages run without changing how the script is
@@ -44,21 +95,126 @@ FINAL_COMPARISON_PDF = 'c3_pcgw_theme_comparison.pdf'
 # - RUN_MAIN_PIPELINE: run the full paper analysis + thematic coding + theme comparison
 # - RUN_SURVEY_BIGRAMS: compute and save TF-IDF bigrams for the survey open-texts
 # - RUN_BIGRAM_TABLE: compute (if needed) and save the LaTeX bigram comparison table
+# - WRITE_PAPERS_JSONL: (re)write the JSON Lines copy of the papers JSON that
+#   load_papers reads instead of the JSON while the copy is up to date
 RUN_MAIN_PIPELINE = True
 RUN_SURVEY_BIGRAMS = True
 RUN_BIGRAM_TABLE = True
 RUN_UNIGRAM_TABLE = False
 RUN_UNIGRAM_MULTICOL = True
+WRITE_PAPERS_JSONL = False
+
 
+# Base font size of the survey plots (survey_analyzer.font_size), kept here so
+# the bar plots can size their text without importing survey_analyzer
+BARPLOT_FONT_SIZE = 24
 
 PAPERS_BAR_COLOR = '#2E86AB'
 SURVEY_BAR_COLOR = '#E67E22'
 
+
+# Sources the look of every plot depends on: this script holds the colours,
+# font size and PLOT_RC_PARAMS, survey_analyzer.py the survey rcParams
+PLOT_STYLE_SOURCES = (
+	os.path.abspath(__file__),
+	os.path.join(os.path.dirname(os.path.abspath(__file__)), 'survey_analyzer.py'),
+)
+
+
+def is_stale(out_path, *deps):
+	"""Return True when out_path is missing or older than any of deps.
+
+	Dependencies that do not exist are ignored. Always True when
+	SKIP_UP_TO_DATE_PLOTS is off.
+	"""
+	if not SKIP_UP_TO_DATE_PLOTS or not os.path.exists(out_path):
+		return True
+	out_mtime = os.path.getmtime(out_path)
+	if any(os.path.getmtime(d) > out_mtime for d in deps if os.path.exists(d)):
+		return True
+	print(f"✓ Up to date, not re-rendered: {out_path}")
+	return False
+
+def json_root_is_object(f):
+	"""Peek at the first non-whitespace byte of a binary JSON file.
+
+	The file position is reset to the start afterwards.
+	"""
+	c = f.read(1)
+	while c.isspace():
+		c = f.read(1)
+	f.seek(0)
+	return c == b'{'
+
+
+def iter_json_records(path, key=None):
+	"""Yield the records of a JSON or JSON Lines (.jsonl) file.
+
+	A .jsonl file holds one record per line and is decoded line by line.
+	Otherwise the records are the top-level array, or the array stored under
+	`key` when the document root is an object. The file is parsed with
+	orjson when it is installed; otherwise ijson streams it one record at a
+	time, and the stdlib json module is the last resort.
+	"""
+	loads = orjson.loads if orjson is not None else json.loads
+	with open(path, 'rb') as f:
+		if path.endswith('.jsonl'):
+			for line in f:
+				if line.strip():
+					yield loads(line)
+			return
+		if orjson is None and ijson is not None:
+			prefix = f'{key}.item' if key and json_root_is_object(f) else 'item'
+			yield from ijson.items(f, prefix, use_float=True)
+			return
+		data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+	if key and isinstance(data, dict):
+		data = data.get(key, [])
+	yield from data
+
+
+def write_jsonl(path, records):
+	"""Write records to path as JSON Lines, one compact record per line."""
+	with open(path, 'wb') as f:
+		for record in records:
+			if orjson is not None:
+				f.write(orjson.dumps(record))
+			else:
+				f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+			f.write(b'\n')
+
+
+# The loaders are cached per path so each JSON file is parsed once per run;
+# they return tuples so callers cannot mutate the cached result.
+def papers_jsonl_path(path=PAPERS_PATH):
+	"""Path of the JSON Lines copy of a papers JSON file."""
+	return os.path.splitext(path)[0] + '.jsonl'
+
+
+def write_papers_jsonl(path=PAPERS_PATH):
+	"""Write the papers of a JSON file to its JSON Lines copy.
+
+	load_papers reads the copy instead of the JSON while it is at least as new,
+	decoding one small record per line instead of the whole document.
+	"""
+	jsonl_path = papers_jsonl_path(path)
+	papers = tuple(iter_json_records(path, key='papers'))
+	write_jsonl(jsonl_path, papers)
+	print(f"✓ Wrote {len(papers)} papers to {jsonl_path}")
+
+
+@lru_cache(maxsize=None)
 def load_papers(path=PAPERS_PATH):
-	with open(path, 'r', encoding='utf-8') as f:
-		data = json.load(f)
-	papers = data.get('papers', []) if isinstance(data, dict) else data
-	print(f"✓ Loaded {len(papers)} papers from {path}")
+	# An up-to-date JSON Lines copy (see write_papers_jsonl) is read instead of
+	# the JSON itself; a stale copy is ignored.
+	jsonl_path = papers_jsonl_path(path)
+	if path.endswith('.jsonl'):
+		read_path, papers = path, tuple(iter_json_records(path))
+	elif os.path.exists(jsonl_path) and os.path.getmtime(jsonl_path) >= os.path.getmtime(path):
+		read_path, papers = jsonl_path, tuple(iter_json_records(jsonl_path))
+	else:
+		read_path, papers = path, tuple(iter_json_records(path, key='papers'))
+	print(f"✓ Loaded {len(papers)} papers from {read_path}")
 	return papers
 
 
@@ -100,38 +256,133 @@ THEMES = {
 }
 
 
-def count_theme_occurrences(docs, themes=THEMES):
+def build_theme_matcher(themes=THEMES):
+	"""Index theme keywords for a single pass over each document.
+
+	Single-token keywords are looked up in the document's token counts.
+	Phrases are found in one scan of the text: an Aho-Corasick automaton when
+	pyahocorasick is installed, otherwise one regex alternation of all
+	phrases. Like `str.count`, occurrences of the same phrase do not overlap,
+	while different phrases may. A keyword listed several times (or under
+	several themes) keeps its multiplicity in the hit counter.
+
+	Returns:
+	  - words: keyword -> Counter(theme -> multiplicity)
+	  - find_phrases: callable yielding a Counter(theme -> multiplicity) for
+	    every phrase occurrence in a lowercased text
+	"""
+	words = {}
+	phrases = {}
+	for theme, keywords in themes.items():
+		for kw in keywords:
+			kw = kw.lower()
+			target = phrases if ' ' in kw else words
+			target.setdefault(kw, Counter())[theme] += 1
+
+	if not phrases:
+		return words, lambda text: ()
+
+	if ahocorasick is not None:
+		automaton = ahocorasick.Automaton()
+		for kw in phrases:
+			automaton.add_word(kw, kw)
+		automaton.make_automaton()
+
+		def find_phrases(text):
+			# matches come in order of their end, so a phrase is counted again
+			# only when it starts after its last counted occurrence ended
+			next_start = {}
+			for end, kw in automaton.iter(text):
+				if end - len(kw) + 1 >= next_start.get(kw, 0):
+					next_start[kw] = end + 1
+					yield phrases[kw]
+		return words, find_phrases
+
+	# The lookahead tries every position, and longest-first alternation picks
+	# the longest phrase starting there; every shorter phrase that also starts
+	# there is a prefix of it. Each phrase then skips positions inside its own
+	# last counted occurrence, as the lookahead alone would let it overlap.
+	prefixes = {kw: [other for other in phrases if kw.startswith(other)] for kw in phrases}
+	alternation = '|'.join(re.escape(kw) for kw in sorted(phrases, key=len, reverse=True))
+	pattern = re.compile(f'(?=({alternation}))')
+
+	def find_phrases(text):
+		next_start = {}
+		for m in pattern.finditer(text):
+			start = m.start()
+			for kw in prefixes[m.group(1)]:
+				if start >= next_start.get(kw, 0):
+					next_start[kw] = start + len(kw)
+					yield phrases[kw]
+	return words, find_phrases
+
+
+# Corpora with more documents than this are counted in parallel chunks.
+PARALLEL_MIN_DOCS = 200
+
+
+def count_theme_occurrences(docs, themes=THEMES, n_jobs=None):
 	"""Count occurrences of theme keywords across a list of documents.
 
+	Corpora larger than PARALLEL_MIN_DOCS are split into chunks that are
+	counted by joblib workers (all cores unless `n_jobs` says otherwise) and
+	summed; `n_jobs=1` always counts in-process.
+
 	Returns:
 	  - theme_counts: Counter-like dict theme -> total keyword matches
 	  - total_words: total number of word tokens across all docs
 	"""
+	docs = list(docs)
+	if n_jobs != 1 and len(docs) > PARALLEL_MIN_DOCS:
+		from joblib import Parallel, cpu_count, delayed
+		n_workers = cpu_count() if n_jobs in (None, -1) else n_jobs
+		# a few chunks per worker keeps them busy without per-document overhead
+		size = max(PARALLEL_MIN_DOCS // 4, -(-len(docs) // (4 * n_workers)))
+		chunks = [docs[i:i + size] for i in range(0, len(docs), size)]
+		results = Parallel(n_jobs=n_workers)(delayed(count_theme_occurrences)(chunk, themes, n_jobs=1) for chunk in chunks)
+		counts = Counter()
+		total_words = 0
+		for chunk_counts, chunk_words in results:
+			counts.update(chunk_counts)
+			total_words += chunk_words
+		return counts, total_words
+
+	from sklearn.feature_extraction.text import CountVectorizer
+	words, find_phrases = build_theme_matcher(themes)
+	texts = [(d or '').lower() for d in docs]
 	counts = Counter()
-	total_words = 0
-	for d in docs:
-		text = (d or '').lower()
-		tokens = simple_tokenize(text)
-		total_words += len(tokens)
-
-		# For each theme, count occurrences of any keyword/phrase
-		for theme, keywords in themes.items():
-			theme_count = 0
-			for kw in keywords:
-				kw = kw.lower()
-				if ' ' in kw:
-					# phrase: count substring occurrences (approximate)
-					theme_count += text.count(kw)
-				else:
-					# single token: count in tokens
-					theme_count += tokens.count(kw)
-			if theme_count:
-				counts[theme] += theme_count
+
+	# single tokens: one sparse document-term matrix for the whole corpus; its
+	# keyword columns times a keyword x theme multiplicity matrix give the totals
+	# texts are lowercased once above and shared with the phrase pass below
+	vect = CountVectorizer(token_pattern=RE_WORD.pattern, lowercase=False)
+	try:
+		X = vect.fit_transform(texts)
+	except ValueError:
+		# no tokens at all
+		total_words = 0
+	else:
+		total_words = int(X.sum())
+		theme_ids = {theme: i for i, theme in enumerate(themes)}
+		present = [kw for kw in words if kw in vect.vocabulary_]
+		weights = np.zeros((len(present), len(theme_ids)), dtype=np.int64)
+		for row, kw in enumerate(present):
+			for theme, mult in words[kw].items():
+				weights[row, theme_ids[theme]] = mult
+		keyword_counts = np.asarray(X[:, [vect.vocabulary_[kw] for kw in present]].sum(axis=0)).ravel()
+		for theme, total in zip(theme_ids, (keyword_counts @ weights).tolist()):
+			if total:
+				counts[theme] += total
+
+	# phrases: count substring occurrences (approximate)
+	for text in texts:
+		for hits in find_phrases(text):
+			counts.update(hits)
 
 	return counts, total_words
 
 
-def compare_themes_between_corpora(survey_docs, paper_docs, themes=THEMES, out_dir=OUT_DIR):
+def compare_themes_between_corpora(survey_docs, paper_docs, themes=THEMES, out_dir=OUT_DIR, plot=True):
 	survey_counts, survey_words = count_theme_occurrences(survey_docs, themes)
 	paper_counts, paper_words = count_theme_occurrences(paper_docs, themes)
 
@@ -153,9 +404,12 @@ def compare_themes_between_corpora(survey_docs, paper_docs, themes=THEMES, out_d
 		})
 
 	df = pd.DataFrame(rows).sort_values('survey_per_1000_words', ascending=False)
-    
+	if not plot:
+		return
+
 	# Plot side-by-side bars for each theme (survey vs papers)
 	# Make the figure taller to accommodate long theme labels and improve readability
+	plt = load_pyplot()
 	fig, ax = plt.subplots(figsize=(12, max(6, len(rows) * 1.1)))
 	ind = np.arange(len(df))
 	width = 0.45
@@ -193,11 +447,15 @@ def compare_themes_between_corpora(survey_docs, paper_docs, themes=THEMES, out_d
 	plots_dir = 'plots'
 	os.makedirs(plots_dir, exist_ok=True)
 	out_plot = os.path.join(plots_dir, globals().get('FINAL_COMPARISON_PDF', 'c3_pcgw_theme_comparison.pdf'))
-	fig.savefig(out_plot, bbox_inches='tight')
+	# no CreationDate, so an unchanged figure gives a byte-identical PDF
+	fig.savefig(out_plot, bbox_inches='tight', backend='pdf', metadata={'CreationDate': None})
 	plt.close(fig)
 	print(f"✓ Theme comparison plot saved to: {out_plot}")
 
 
+# Stdlib `re` on purpose: on the paper corpus re2's findall is ~20x slower
+# (per-match wrapper overhead) and the `regex` module ~30% slower, and re2's
+# ASCII-only \b would also split words next to accented letters differently.
 RE_WORD = re.compile(r"\b[a-zA-Z]{2,}\b")
 
 
@@ -207,24 +465,22 @@ def simple_tokenize(text):
 	return RE_WORD.findall(text.lower())
 
 
-def load_survey_texts(path='procedural-level-generation-survey.json'):
-	"""Load survey JSON and return a list of open-text responses.
+@lru_cache(maxsize=None)
+def load_survey_texts(path=SURVEY_PATH):
+	"""Load survey JSON and return a tuple of open-text responses.
 
 	Uses the same 'most_important_problem' field as the survey analysis script.
 	"""
 	if not os.path.exists(path):
 		print(f"⚠ Survey file not found: {path}")
-		return []
-	with open(path, 'r', encoding='utf-8') as f:
-		data = json.load(f)
-
+		return ()
 	texts = []
-	for entry in data:
+	for entry in iter_json_records(path):
 		resp = entry.get('most_important_problem')
 		if resp and resp.strip():
 			texts.append(resp.strip())
 	print(f"✓ Loaded {len(texts)} survey open-text responses from {path}")
-	return texts
+	return tuple(texts)
 
 
 def corpus_from_papers(papers):
@@ -239,28 +495,144 @@ def corpus_from_papers(papers):
 	return docs, pd.DataFrame(rows)
 
 
+def top_order(values, top_n):
+	"""Indices of the top_n largest values, largest first.
+
+	Ties keep their index order. np.partition finds the cut-off in linear
+	time, so only the selected slice is sorted instead of the whole array.
+	"""
+	n = len(values)
+	if top_n <= 0:
+		return np.arange(0)
+	if top_n < n:
+		kth = np.partition(values, n - top_n)[n - top_n]
+		above = np.flatnonzero(values > kth)
+		ties = np.flatnonzero(values == kth)[:top_n - len(above)]
+		idx = np.sort(np.concatenate([above, ties]))
+	else:
+		idx = np.arange(n)
+	return idx[np.argsort(-values[idx], kind='stable')]
+
+
 def top_term_frequencies(docs, top_n=40):
-	c = Counter()
-	for d in docs:
-		c.update(simple_tokenize(d))
-	df = pd.DataFrame(c.most_common(), columns=['term', 'count'])
+	from sklearn.feature_extraction.text import CountVectorizer
+	vect = CountVectorizer(token_pattern=RE_WORD.pattern, lowercase=True)
+	try:
+		X = vect.fit_transform([d or '' for d in docs])
+	except ValueError:
+		# no tokens at all
+		return pd.DataFrame({'term': [], 'count': [], 'rank': []})
+	sums = np.asarray(X.sum(axis=0)).ravel()
+	# vocabulary_ keeps the order in which terms were first seen, so a stable
+	# sort on it breaks count ties the same way Counter.most_common() does
+	terms = np.array(list(vect.vocabulary_.keys()), dtype=object)
+	counts = sums[np.fromiter(vect.vocabulary_.values(), dtype=np.intp, count=len(terms))]
+	order = top_order(counts, top_n)
+	df = pd.DataFrame({'term': terms[order], 'count': counts[order]})
 	df['rank'] = range(1, len(df) + 1)
-	return df.head(top_n)
+	return df
+
+
+# Corpora with at least this many documents are ranked through
+# compute_tfidf_hashed, which never builds the full n-gram vocabulary.
+HASHING_MIN_DOCS = 20000
 
 
 def compute_tfidf(docs, top_n=40, ngram_range=(1, 1)):
-	vect = TfidfVectorizer(stop_words='english', ngram_range=ngram_range, max_features=5000)
-	X = vect.fit_transform(docs)
+	return compute_tfidf_ngrams(docs, [ngram_range], top_n=top_n)[ngram_range]
+
+
+def compute_tfidf_ngrams(docs, ngram_ranges, top_n=40, max_features=5000):
+	"""Rank mean TF-IDF terms for several n-gram ranges from one tokenization.
+
+	The documents are tokenized and counted once over the union of the
+	ranges; each range then gets its own column subset, `max_features` cut
+	and TF-IDF weighting, so every range gets the same terms and ranks as a
+	separate TfidfVectorizer(stop_words='english', ngram_range=...) fit
+	(scores agree up to floating-point summation order).
+
+	Returns:
+	  - dict ngram_range -> DataFrame with term, tfidf and rank columns
+	"""
+	ngram_ranges = [tuple(r) for r in ngram_ranges]
+	if len(docs) >= HASHING_MIN_DOCS:
+		return {r: compute_tfidf_hashed(docs, top_n=top_n, ngram_range=r) for r in ngram_ranges}
+	from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+	vect = CountVectorizer(stop_words='english', ngram_range=(min(r[0] for r in ngram_ranges), max(r[1] for r in ngram_ranges)))
+	counts = vect.fit_transform(docs)
+	terms = vect.get_feature_names_out()
+	# n-grams are joined with single spaces and tokens never contain one
+	term_lengths = np.char.count(terms.astype(str), ' ') + 1
+
+	results = {}
+	for ngram_range in ngram_ranges:
+		cols = np.flatnonzero((term_lengths >= ngram_range[0]) & (term_lengths <= ngram_range[1]))
+		X = counts[:, cols]
+		if max_features is not None and len(cols) > max_features:
+			# same selection as CountVectorizer's max_features: highest corpus
+			# frequency first, kept columns stay in vocabulary order
+			tfs = np.asarray(X.sum(axis=0)).ravel()
+			keep = np.sort((-tfs).argsort()[:max_features])
+			cols = cols[keep]
+			X = counts[:, cols]
+		X = TfidfTransformer().fit_transform(X)
+		# average tf-idf across documents
+		mean_tfidf = np.asarray(X.mean(axis=0)).ravel()
+		# full sort on purpose: many terms tie on their mean score, and the
+		# published tables depend on the order this sort leaves them in
+		df = pd.DataFrame({'term': terms[cols], 'tfidf': mean_tfidf})
+		df = df.sort_values('tfidf', ascending=False).reset_index(drop=True)
+		df['rank'] = df.index + 1
+		results[ngram_range] = df.head(top_n)
+	return results
+
+
+def hashed_column(term, n_features):
+	"""Column HashingVectorizer assigns to `term` (mirrors FeatureHasher)."""
+	from sklearn.utils import murmurhash3_32
+	h = murmurhash3_32(term, seed=0)
+	if h == -2147483648:
+		return (2147483647 - (n_features - 1)) % n_features
+	return abs(h) % n_features
+
+
+def compute_tfidf_hashed(docs, top_n=40, ngram_range=(1, 1), n_features=2 ** 20):
+	"""Rank mean TF-IDF terms without building an n-gram vocabulary.
+
+	On large corpora the dict of every distinct n-gram dominates the memory
+	and time of a vectorizer fit, although only the top few terms are
+	reported. HashingVectorizer maps n-grams straight to columns; only the
+	top_n columns are mapped back to a term, by re-analyzing one document
+	that contains each of them. Colliding n-grams share a column and there
+	is no max_features cut, so scores can differ slightly from
+	`compute_tfidf_ngrams`.
+	"""
+	from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+	docs = list(docs)
+	hasher = HashingVectorizer(stop_words='english', ngram_range=ngram_range, n_features=n_features, alternate_sign=False, norm=None)
+	X = TfidfTransformer().fit_transform(hasher.transform(docs))
 	# average tf-idf across documents
 	mean_tfidf = np.asarray(X.mean(axis=0)).ravel()
-	terms = vect.get_feature_names_out()
-	df = pd.DataFrame({'term': terms, 'tfidf': mean_tfidf})
-	df = df.sort_values('tfidf', ascending=False).reset_index(drop=True)
+	nonzero = np.flatnonzero(mean_tfidf)
+	top = nonzero[top_order(mean_tfidf[nonzero], top_n)]
+
+	# first document containing each wanted column (CSC indices are sorted)
+	top_cols = X[:, top].tocsc()
+	first_doc = top_cols.indices[top_cols.indptr[:-1]]
+	analyzer = hasher.build_analyzer()
+	col_terms = dict.fromkeys(top.tolist())
+	for doc_id in dict.fromkeys(first_doc.tolist()):
+		for term in analyzer(docs[doc_id]):
+			col = hashed_column(term, n_features)
+			if col in col_terms and col_terms[col] is None:
+				col_terms[col] = term
+
+	df = pd.DataFrame({'term': [col_terms[c] for c in top.tolist()], 'tfidf': mean_tfidf[top]})
 	df['rank'] = df.index + 1
-	return df.head(top_n)
+	return df
 
 
-def compute_and_save_survey_bigrams(survey_path='procedural-level-generation-survey.json', out_dir=OUT_DIR, top_n=200):
+def compute_and_save_survey_bigrams(survey_path=SURVEY_PATH, out_dir=OUT_DIR, top_n=200):
 	"""Compute TF-IDF for survey open-text bigrams and save CSV to out_dir.
 
 	This replicates the ad-hoc script used interactively; exposing it here
@@ -278,10 +650,28 @@ def compute_and_save_survey_bigrams(survey_path='procedural-level-generation-sur
 	return out_csv
 
 
-def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigrams_csv=None, out_dir=OUT_DIR, top_n=15, decimals=3):
+# Characters with a special meaning in LaTeX. str.translate substitutes them
+# in one pass, so the backslashes it inserts are never escaped again.
+LATEX_ESCAPES = str.maketrans({
+	'&':'\\&', '%':'\\%', '$':'\\$', '#':'\\#', '_':'\\_', '{':'\\{',
+	'}':'\\}', '~':'\\textasciitilde{}', '^':'\\textasciicircum{}', '\\':'\\textbackslash{}'
+})
+
+
+def latex_escape(s: str) -> str:
+	"""Escape problematic LaTeX characters and collapse whitespace."""
+	if not isinstance(s, str):
+		return s
+	return ' '.join(s.translate(LATEX_ESCAPES).split())
+
+
+def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigrams_csv=None, out_dir=OUT_DIR, top_n=15, decimals=3,
+											df_paper_bigrams=None, df_survey_bigrams=None):
 	"""Create a LaTeX table comparing the top N bigrams from papers and survey.
 
-	If the CSVs are not present, the function will compute the bigrams first.
+	Bigram DataFrames already in memory can be passed as df_paper_bigrams /
+	df_survey_bigrams; otherwise they are read from the CSVs, and if the CSVs
+	are not present, the function will compute the bigrams first.
 	The resulting .tex file is saved to out_dir/bigram_comparison_table.tex.
 	"""
 	# ensure bigram CSVs exist (compute if necessary)
@@ -291,7 +681,9 @@ def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigr
 		survey_bigrams_csv = os.path.join(out_dir, 'survey_tfidf_bigrams.csv')
 
 	# compute paper bigrams if missing
-	if not os.path.exists(paper_bigrams_csv):
+	if df_paper_bigrams is not None:
+		df_p = df_paper_bigrams
+	elif not os.path.exists(paper_bigrams_csv):
 		# need papers
 		papers = load_papers()
 		docs, _ = corpus_from_papers(papers)
@@ -302,25 +694,17 @@ def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigr
 		df_p = pd.read_csv(paper_bigrams_csv)
 
 	# compute survey bigrams if missing
-	if not os.path.exists(survey_bigrams_csv):
+	if df_survey_bigrams is not None:
+		df_s = df_survey_bigrams
+	elif not os.path.exists(survey_bigrams_csv):
 		compute_and_save_survey_bigrams(out_dir=out_dir)
 		df_s = pd.read_csv(survey_bigrams_csv)
 	else:
 		df_s = pd.read_csv(survey_bigrams_csv)
 
-	df_p_top = df_p.head(top_n).reset_index(drop=True)
-	df_s_top = df_s.head(top_n).reset_index(drop=True)
-
-	def latex_escape(s: str) -> str:
-		if not isinstance(s, str):
-			return s
-		replacements = {
-			'&':'\\&', '%':'\\%', '$':'\\$', '#':'\\#', '_':'\\_', '{':'\\{',
-			'}':'\\}', '~':'\\textasciitilde{}', '^':'\\textasciicircum{}', '\\':'\\textbackslash{}'
-		}
-		for k,v in replacements.items():
-			s = s.replace(k,v)
-		return ' '.join(s.split())
+	# plain arrays: indexing them per row avoids an iloc lookup and Series per cell
+	p_terms, p_tfidf = df_p['term'].head(top_n).to_numpy(), df_p['tfidf'].head(top_n).to_numpy()
+	s_terms, s_tfidf = df_s['term'].head(top_n).to_numpy(), df_s['tfidf'].head(top_n).to_numpy()
 
 	out_tex = os.path.join(out_dir, 'bigram_comparison_table.tex')
 	header = rf"""\begin{{table}}[h]
@@ -335,12 +719,12 @@ def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigr
 
 	rows = []
 	for i in range(top_n):
-		p_term = latex_escape(str(df_p_top.iloc[i]['term'])) if i < len(df_p_top) else ''
-		p_tfidf = df_p_top.iloc[i]['tfidf'] if i < len(df_p_top) else 0.0
-		s_term = latex_escape(str(df_s_top.iloc[i]['term'])) if i < len(df_s_top) else ''
-		s_tfidf = df_s_top.iloc[i]['tfidf'] if i < len(df_s_top) else 0.0
-		left = f"{p_term} ({p_tfidf:.{decimals}f})"
-		right = f"{s_term} ({s_tfidf:.{decimals}f})"
+		p_term = latex_escape(str(p_terms[i])) if i < len(p_terms) else ''
+		p_score = p_tfidf[i] if i < len(p_tfidf) else 0.0
+		s_term = latex_escape(str(s_terms[i])) if i < len(s_terms) else ''
+		s_score = s_tfidf[i] if i < len(s_tfidf) else 0.0
+		left = f"{p_term} ({p_score:.{decimals}f})"
+		right = f"{s_term} ({s_score:.{decimals}f})"
 		rows.append(f"{left} & {right} \\\\")
 
 	footer = r"""\hline
@@ -348,10 +732,13 @@ def compute_and_save_bigram_comparison_table(paper_bigrams_csv=None, survey_bigr
 \end{table}
 """
 
-	content = header + '\n'.join(rows) + '\n' + footer
 	os.makedirs(out_dir, exist_ok=True)
+	# write the pieces straight to the file instead of concatenating them first
 	with open(out_tex, 'w', encoding='utf-8') as f:
-		f.write(content)
+		f.write(header)
+		f.write('\n'.join(rows))
+		f.write('\n')
+		f.write(footer)
 
 	print(f"✓ Saved LaTeX bigram comparison table to: {out_tex}")
 	return out_tex
@@ -379,18 +766,6 @@ def compute_and_save_unigram_table(unigram_csv=None, out_dir=OUT_DIR, decimals=6
 	else:
 		df_u = pd.read_csv(unigram_csv)
 
-	# helper to escape problematic LaTeX characters
-	def latex_escape(s: str) -> str:
-		if not isinstance(s, str):
-			return s
-		replacements = {
-			'&':'\\&', '%':'\\%', '$':'\\$', '#':'\\#', '_':'\\_', '{':'\\{',
-			'}':'\\}', '~':'\\textasciitilde{}', '^':'\\textasciicircum{}', '\\':'\\textbackslash{}'
-		}
-		for k,v in replacements.items():
-			s = s.replace(k,v)
-		return ' '.join(s.split())
-
 	out_tex = os.path.join(out_dir, 'pcg_papers_unigrams_table.tex')
 
 	header = """% Auto-generated unigram TF-IDF table for Appendix
@@ -578,15 +953,27 @@ def code_response(text, themes=THEMES):
 	return found
 
 
-def perform_thematic_coding_from_df(df, text_field='text'):
-	coded = []
-	for _, row in df.iterrows():
-		txt = row.get(text_field, '')
-		themes_found = code_response(txt)
-		coded.append({'title': row.get('title', ''),
-					  'themes': themes_found,
-					  'num_themes': len(themes_found)})
-	return pd.DataFrame(coded)
+def perform_thematic_coding_from_df(df, text_field='text', themes=THEMES):
+	"""Vectorized `code_response` over a DataFrame column.
+
+	Each theme's keywords become one regex alternation that is run down the
+	whole lowercased column with `str.contains`, instead of iterating rows.
+	"""
+	if text_field in df:
+		text = df[text_field].fillna('').str.lower()
+	else:
+		text = pd.Series('', index=df.index)
+	hits = np.zeros((len(df), len(themes)), dtype=bool)
+	for col, keywords in enumerate(themes.values()):
+		if keywords:
+			pattern = '|'.join(re.escape(kw) for kw in keywords)
+			hits[:, col] = text.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+	names = np.array(list(themes), dtype=object)
+	return pd.DataFrame({
+		'title': df['title'].to_numpy() if 'title' in df else '',
+		'themes': [list(names[row]) for row in hits],
+		'num_themes': hits.sum(axis=1),
+	})
 
 
 def calculate_theme_stats_df(coded_df):
@@ -600,20 +987,17 @@ def calculate_theme_stats_df(coded_df):
 
 
 def calculate_cooccurrence_matrix_from_coded(coded_df):
-	from collections import defaultdict
 	from itertools import combinations
-	co = defaultdict(lambda: defaultdict(int))
+	all_themes = sorted({t for themes in coded_df['themes'] for t in themes})
+	theme_to_id = {t: i for i, t in enumerate(all_themes)}
+	# count into a plain array and wrap it once; ids follow the sorted theme order
+	mat = np.zeros((len(all_themes), len(all_themes)), dtype=np.int32)
 	for themes in coded_df['themes']:
 		if len(themes) > 1:
-			for a, b in combinations(sorted(themes), 2):
-				co[a][b] += 1
-				co[b][a] += 1
-	all_themes = sorted({t for themes in coded_df['themes'] for t in themes})
-	mat = pd.DataFrame(0, index=all_themes, columns=all_themes)
-	for a in co:
-		for b in co[a]:
-			mat.loc[a, b] = co[a][b]
-	return mat
+			for i, j in combinations(sorted(theme_to_id[t] for t in themes), 2):
+				mat[i, j] += 1
+				mat[j, i] += 1
+	return pd.DataFrame(mat, index=all_themes, columns=all_themes)
 
 
 def create_and_save_theme_network(theme_stats_df, cooccurrence_matrix, out_path):
@@ -627,6 +1011,7 @@ def create_and_save_theme_network(theme_stats_df, cooccurrence_matrix, out_path)
 				G.add_edge(i, j, weight=int(cooccurrence_matrix.loc[i, j]))
 
 	# simple plotting
+	plt = load_pyplot()
 	plt.figure(figsize=(9, 9))
 	pos = nx.spring_layout(G, seed=42)
 	sizes = [G.nodes[n].get('count', 1) * 200 for n in G.nodes()]
@@ -645,18 +1030,21 @@ def create_and_save_theme_network(theme_stats_df, cooccurrence_matrix, out_path)
 
 
 def save_barplot(df, value_col, title, out_path, top_n=25):
-	# Use the project's survey plotting style (font family/size) by relying on
-	# `survey_analyzer` which already configures matplotlib rcParams.
+	if out_path.endswith('.svg'):
+		return save_barplot_svg(df, value_col, title, out_path, top_n=top_n)
+	# Use the project's survey plotting style (font family/size) through
+	# load_pyplot, which imports `survey_analyzer` and its matplotlib rcParams.
 	df_plot = df.head(top_n).iloc[::-1]
 	# Figure width chosen to match survey plotting defaults
 	fig_w = 12.0
 	fig_h = max(4, top_n * 0.18)
+	plt = load_pyplot()
 	fig, ax = plt.subplots(figsize=(fig_w, fig_h))
 	# Use module-level default color for paper plots unless overridden by caller
 	default_color = globals().get('PAPERS_BAR_COLOR', 'steelblue')
 	ax.barh(df_plot['term'], df_plot[value_col], color=default_color)
 	# Use survey font sizes where appropriate
-	base_font = getattr(survey_analyzer, 'font_size', 24)
+	base_font = BARPLOT_FONT_SIZE
 	ax.set_xlabel(value_col, fontsize=max(10, base_font - 6))
 	ax.set_title(title, fontsize=max(12, base_font - 6))
 	ax.tick_params(labelsize=max(8, base_font - 8))
@@ -666,17 +1054,70 @@ def save_barplot(df, value_col, title, out_path, top_n=25):
 	print(f"✓ Saved plot: {out_path}")
 
 
+def save_barplot_svg(df, value_col, title, out_path, top_n=25):
+	"""Write the `save_barplot` chart as a hand-written SVG.
+
+	A few dozen labelled bars need no figure, layout engine or PNG encoder,
+	so this skips matplotlib entirely. Sizes are in points and follow the
+	same survey font sizes as `save_barplot`.
+	"""
+	from xml.sax.saxutils import escape
+	df_plot = df.head(top_n)
+	terms = [str(t) for t in df_plot['term']]
+	values = [float(v) for v in df_plot[value_col]]
+
+	base_font = BARPLOT_FONT_SIZE
+	tick_font = max(8, base_font - 8)
+	label_font = max(10, base_font - 6)
+	title_font = max(12, base_font - 6)
+	row_h = tick_font * 1.5
+	# rough average glyph width, enough to keep long terms inside the canvas
+	label_w = tick_font * (0.55 * max((len(t) for t in terms), default=0) + 1)
+	plot_w = 12.0 * 72 - label_w - tick_font * 5
+	plot_top = title_font * 2
+	plot_bottom = plot_top + row_h * len(terms)
+	width = 12.0 * 72
+	height = plot_bottom + label_font * 3
+	vmax = max(values, default=0.0) or 1.0
+	color = globals().get('PAPERS_BAR_COLOR', 'steelblue')
+
+	parts = [
+		f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}pt" height="{height:.0f}pt" '
+		f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="serif">',
+		f'<rect width="100%" height="100%" fill="white"/>',
+		f'<text x="{width / 2:.1f}" y="{title_font * 1.3:.1f}" font-size="{title_font}" text-anchor="middle">{escape(title)}</text>',
+	]
+	for i, (term, value) in enumerate(zip(terms, values)):
+		y = plot_top + i * row_h
+		bar_w = max(value, 0.0) / vmax * plot_w
+		text_y = y + row_h / 2 + tick_font * 0.35
+		parts.append(f'<text x="{label_w - tick_font / 2:.1f}" y="{text_y:.1f}" font-size="{tick_font}" text-anchor="end">{escape(term)}</text>')
+		parts.append(f'<rect x="{label_w:.1f}" y="{y + row_h * 0.1:.1f}" width="{bar_w:.1f}" height="{row_h * 0.8:.1f}" fill="{color}"/>')
+		parts.append(f'<text x="{label_w + bar_w + tick_font / 3:.1f}" y="{text_y:.1f}" font-size="{tick_font * 0.8:.1f}">{value:.4g}</text>')
+	parts.append(f'<line x1="{label_w:.1f}" y1="{plot_top:.1f}" x2="{label_w:.1f}" y2="{plot_bottom:.1f}" stroke="black"/>')
+	parts.append(f'<line x1="{label_w:.1f}" y1="{plot_bottom:.1f}" x2="{label_w + plot_w:.1f}" y2="{plot_bottom:.1f}" stroke="black"/>')
+	parts.append(f'<text x="{label_w + plot_w / 2:.1f}" y="{plot_bottom + label_font * 1.8:.1f}" font-size="{label_font}" text-anchor="middle">{escape(value_col)}</text>')
+	parts.append('</svg>')
+
+	with open(out_path, 'w', encoding='utf-8') as f:
+		f.write('\n'.join(parts) + '\n')
+	print(f"✓ Saved plot: {out_path}")
+
+
 def main(only_comparison=False):
 	papers = load_papers()
 	docs, df_meta = corpus_from_papers(papers)
 
 	# Fast path: when only the final theme-comparison is needed, skip all
 	# intermediate CSVs/plots and produce only the comparison CSV + PDF.
+	plot_deps = (PAPERS_PATH, *PLOT_STYLE_SOURCES)
+	comparison_pdf = os.path.join('plots', FINAL_COMPARISON_PDF)
 	if only_comparison:
-		survey_docs = load_survey_texts('procedural-level-generation-survey.json')
-		compare_themes_between_corpora(survey_docs, docs, themes=THEMES, out_dir=OUT_DIR)
+		survey_docs = load_survey_texts(SURVEY_PATH)
+		compare_themes_between_corpora(survey_docs, docs, themes=THEMES, out_dir=OUT_DIR,
+			plot=is_stale(comparison_pdf, SURVEY_PATH, *plot_deps))
 		print('\nDone (only comparison).')
-		return
+		return None
 
 	# Quick sanity
 	num_with_abstract = sum(1 for a in df_meta['abstract'] if a and a.strip())
@@ -687,21 +1128,28 @@ def main(only_comparison=False):
 	tf_csv = os.path.join(OUT_DIR, 'pcg_papers_term_frequencies.csv')
 	tf_df.to_csv(tf_csv, index=False)
 	print(f"✓ Term frequency CSV saved to: {tf_csv}")
-	save_barplot(tf_df, 'count', 'Top terms (frequency)', os.path.join(OUT_DIR, 'pcg_papers_top_terms_freq.png'), top_n=30)
+	freq_png = os.path.join(OUT_DIR, 'pcg_papers_top_terms_freq.' + BARPLOT_FORMAT)
+	if is_stale(freq_png, *plot_deps):
+		save_barplot(tf_df, 'count', 'Top terms (frequency)', freq_png, top_n=30)
 
-	# TF-IDF unigrams
-	tfidf_unigram = compute_tfidf(docs, top_n=200, ngram_range=(1, 1))
+	# TF-IDF unigrams and bigrams from a single tokenization pass
+	tfidf_by_ngram = compute_tfidf_ngrams(docs, [(1, 1), (2, 2)], top_n=200)
+	tfidf_unigram = tfidf_by_ngram[(1, 1)]
 	tfidf_csv = os.path.join(OUT_DIR, 'pcg_papers_tfidf_unigrams.csv')
 	tfidf_unigram.to_csv(tfidf_csv, index=False)
 	print(f"✓ TF-IDF (unigrams) CSV saved to: {tfidf_csv}")
-	save_barplot(tfidf_unigram, 'tfidf', 'Top terms (TF-IDF)', os.path.join(OUT_DIR, 'pcg_papers_top_terms_tfidf.png'), top_n=30)
+	tfidf_png = os.path.join(OUT_DIR, 'pcg_papers_top_terms_tfidf.' + BARPLOT_FORMAT)
+	if is_stale(tfidf_png, *plot_deps):
+		save_barplot(tfidf_unigram, 'tfidf', 'Top terms (TF-IDF)', tfidf_png, top_n=30)
 
 	# TF-IDF bigrams (useful for multi-word phrases)
-	tfidf_bigrams = compute_tfidf(docs, top_n=200, ngram_range=(2, 2))
+	tfidf_bigrams = tfidf_by_ngram[(2, 2)]
 	bigram_csv = os.path.join(OUT_DIR, 'pcg_papers_tfidf_bigrams.csv')
 	tfidf_bigrams.to_csv(bigram_csv, index=False)
 	print(f"✓ TF-IDF (bigrams) CSV saved to: {bigram_csv}")
-	save_barplot(tfidf_bigrams, 'tfidf', 'Top bigrams (TF-IDF)', os.path.join(OUT_DIR, 'pcg_papers_top_bigrams_tfidf.png'), top_n=30)
+	bigram_png = os.path.join(OUT_DIR, 'pcg_papers_top_bigrams_tfidf.' + BARPLOT_FORMAT)
+	if is_stale(bigram_png, *plot_deps):
+		save_barplot(tfidf_bigrams, 'tfidf', 'Top bigrams (TF-IDF)', bigram_png, top_n=30)
 
 	# Save a small sample of the metadata for reference
 	meta_csv = os.path.join(OUT_DIR, 'pcg_papers_metadata_sample.csv')
@@ -735,16 +1183,21 @@ def main(only_comparison=False):
 	print(f"✓ Co-occurrence matrix CSV saved to: {cooc_csv}")
 
 	net_png = os.path.join(OUT_DIR, 'pcg_papers_theme_network.png')
-	G = create_and_save_theme_network(theme_stats_df, cooc, net_png)
-	print(f"✓ Theme network image saved to: {net_png}")
+	if is_stale(net_png, *plot_deps):
+		create_and_save_theme_network(theme_stats_df, cooc, net_png)
+		print(f"✓ Theme network image saved to: {net_png}")
 
 	# -------------------------
 	# Compare themes normalized by total words between survey responses and papers
 	# -------------------------
 	# Load survey open-ended responses (field: most_important_problem)
-	survey_docs = load_survey_texts('procedural-level-generation-survey.json')
-	# compare and save CSV/plot
-	compare_themes_between_corpora(survey_docs, docs, themes=THEMES, out_dir=OUT_DIR)
+	survey_docs = load_survey_texts(SURVEY_PATH)
+	# compare and save the plot, unless it is already up to date
+	compare_themes_between_corpora(survey_docs, docs, themes=THEMES, out_dir=OUT_DIR,
+		plot=is_stale(comparison_pdf, SURVEY_PATH, *plot_deps))
+
+	# handed to the bigram table so it does not re-read the CSV written above
+	return tfidf_bigrams
 
 
 if __name__ == '__main__':
@@ -757,14 +1210,20 @@ if __name__ == '__main__':
 	print(f"  RUN_BIGRAM_TABLE={RUN_BIGRAM_TABLE}")
 	print(f"  ONLY_COMPARISON={ONLY_COMPARISON}")
 
+	if WRITE_PAPERS_JSONL:
+		write_papers_jsonl(PAPERS_PATH)
+
+	# The main pipeline runs first so the bigram table can reuse its paper
+	# bigrams in memory; without it the table falls back to the CSVs.
+	paper_bigrams = None
+	if RUN_MAIN_PIPELINE:
+		paper_bigrams = main(only_comparison=ONLY_COMPARISON)
+
 	if RUN_SURVEY_BIGRAMS:
-		compute_and_save_survey_bigrams(survey_path='procedural-level-generation-survey.json', out_dir=OUT_DIR, top_n=200)
+		compute_and_save_survey_bigrams(survey_path=SURVEY_PATH, out_dir=OUT_DIR, top_n=200)
 
 	if RUN_BIGRAM_TABLE:
-		compute_and_save_bigram_comparison_table(out_dir=OUT_DIR, top_n=15, decimals=3)
-
-	if RUN_MAIN_PIPELINE:
-		main(only_comparison=ONLY_COMPARISON)
+		compute_and_save_bigram_comparison_table(out_dir=OUT_DIR, top_n=15, decimals=3, df_paper_bigrams=paper_bigrams)
 	if globals().get('RUN_UNIGRAM_TABLE', False):
 		compute_and_save_unigram_table(out_dir=OUT_DIR, decimals=6)
 
@@ -4,22 +4,42 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
+import pandas as pd
+
 
 def load_json(path: Path) -> Any:
 	with path.open("r", encoding="utf-8") as file:
 		return json.load(file)
 
 
-def is_answered(value: Any) -> bool:
-	if value is None:
-		return False
-	if isinstance(value, str):
-		return value.strip() != ""
-	if isinstance(value, list):
-		return len(value) > 0
-	if isinstance(value, dict):
-		return any(is_answered(item_value) for item_value in value.values())
-	return True
+# Whether each answer in the column counts as answered: non-blank text, non-empty lists,
+# and for matrix questions, any answered item. Built as one mask per column.
+def answered_mask(values: pd.Series) -> pd.Series:
+	kinds = values.map(type)
+	is_text = kinds.eq(str)
+	is_list = kinds.eq(list)
+	is_dict = kinds.eq(dict)
+
+	def per_answer(answered: pd.Series) -> pd.Series:
+		return answered.reindex(values.index, fill_value=False).astype(bool)
+
+	text_answered = per_answer(values[is_text].str.strip().ne(""))
+	list_answered = per_answer(values[is_list].str.len().gt(0))
+
+	# Matrix answers count when any of their items is answered
+	dict_answered = per_answer(pd.Series(False, index=values.index[is_dict]))
+	if is_dict.any():
+		items = pd.DataFrame(values[is_dict].tolist(), index=values.index[is_dict], dtype=object)
+		dict_answered = per_answer(items.apply(answered_mask).any(axis=1))
+
+	# Pick the rule for each answer's kind; anything else counts when present
+	mask = np.select(
+		[is_text, is_list, is_dict],
+		[text_answered, list_answered, dict_answered],
+		default=values.notna(),
+	)
+	return pd.Series(mask, index=values.index)
 
 
 def count_answers_by_question(
@@ -28,34 +48,42 @@ def count_answers_by_question(
 ) -> List[Dict[str, Any]]:
 	total_respondents = len(responses)
 	counts: List[Dict[str, Any]] = []
+	answers = pd.DataFrame(responses, dtype=object)
+	unanswered = pd.Series(None, index=answers.index, dtype=object)
 
 	for question_key, question_info in schema_questions.items():
 		question_text = question_info.get("question", question_key)
 		question_type = question_info.get("type", "unknown")
 
-		answered_count = sum(
-			1 for response in responses if is_answered(response.get(question_key))
-		)
+		column = answers[question_key] if question_key in answers else unanswered
+
+		if question_type == "matrix":
+			is_dict = column.map(type).eq(dict)
+			item_answers = pd.DataFrame(
+				column[is_dict].tolist(),
+				index=column.index[is_dict],
+				dtype=object,
+			).reindex(column.index)
+			# One mask per item column serves both the item counts and the question count,
+			# where a matrix answer counts when any of its items is answered
+			item_masks = item_answers.apply(answered_mask).astype(bool)
+			answered = item_masks.any(axis=1) | answered_mask(column.mask(is_dict))
+			item_counts = {
+				item: int(item_masks[item].sum()) if item in item_masks else 0
+				for item in question_info.get("items", [])
+			}
+		else:
+			answered = answered_mask(column)
 
 		result_row: Dict[str, Any] = {
 			"question_key": question_key,
 			"question_type": question_type,
 			"question_text": question_text,
-			"responses": answered_count,
+			"responses": int(answered.sum()),
 			"total_respondents": total_respondents,
 		}
 
 		if question_type == "matrix":
-			items = question_info.get("items", [])
-			item_counts: Dict[str, int] = {}
-
-			for item in items:
-				item_counts[item] = sum(
-					1
-					for response in responses
-					if is_answered((response.get(question_key) or {}).get(item))
-				)
-
 			result_row["matrix_item_responses"] = item_counts
 
 		counts.append(result_row)
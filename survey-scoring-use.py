@@ -10,18 +10,45 @@ import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Hardcoded survey file path
 SURVEY_FILE = "procedural-level-generation-survey.json"
 
-# Load survey data from the hardcoded JSON file
+# Answers of the level generation frequency question, from most to least frequent.
+# Counts and weights are arrays laid out in this order.
+FREQUENCY_CATEGORIES = (
+    "Always (essential part of workflow)",
+    "Often (most projects)",
+    "Sometimes (about half of projects)",
+    "Rarely (a few projects)",
+    "Never"
+)
+FREQUENCY_INDEX = {label: i for i, label in enumerate(FREQUENCY_CATEGORIES)}
+
+# Weighting schemes to compare, one weight per frequency category (Always ... Never)
+WEIGHTING_SCHEMES = {
+    "Original Linear": np.array([1.0, 0.75, 0.5, 0.25, 0.0]),
+    "Exponential Scale": np.array([1.0, 0.8, 0.5, 0.2, 0.0]),
+    "Adoption-Stage Based": np.array([1.0, 0.85, 0.45, 0.15, 0.0]),
+    "Domain-Specific": np.array([1.0, 0.7, 0.4, 0.1, 0.0]),
+    "Logarithmic": np.array([1.0, 0.69, 0.41, 0.18, 0.0])
+}
+
+# Load survey data from the hardcoded JSON file into a DataFrame, one row per response
+# (parsed with orjson when it is installed)
 def load_survey_data():
     file_path = Path(SURVEY_FILE)
     
     if not file_path.exists():
         raise FileNotFoundError(f"Survey file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    return pd.DataFrame(data)
 
 # Extract frequency data from survey responses for scoring analysis
 def extract_frequency_data(survey_data, role_mapping=None):
@@ -40,38 +67,28 @@ def extract_frequency_data(survey_data, role_mapping=None):
     for category in role_mapping.keys():
         frequency_data[category] = {}
     
-    # Define expected frequency categories
-    frequency_categories = [
-        "Always (essential part of workflow)",
-        "Often (most projects)", 
-        "Sometimes (about half of projects)",
-        "Rarely (a few projects)",
-        "Never"
-    ]
-    
-    # Process each response
-    valid_responses = 0
-    for response in survey_data:
-        # Skip if missing required fields
-        if 'level_generation_frequency' not in response or 'professional_role' not in response:
-            continue
-            
-        if not response['level_generation_frequency'] or not response['professional_role']:
-            continue
-            
-        role = response['professional_role']
-        frequency = response['level_generation_frequency']
-        valid_responses += 1
-        
-        # Find which category this role belongs to
-        for category, roles in role_mapping.items():
-            if role in roles:
-                frequency_data[category][frequency] = frequency_data[category].get(frequency, 0) + 1
-                break
+    # Keep the responses that answered both the role and the frequency question
+    # (survey_data is the loaded DataFrame, or a list of response dicts)
+    responses = pd.DataFrame(survey_data, columns=['professional_role', 'level_generation_frequency'])
+    valid = responses.fillna('').ne('').all(axis=1)
+    responses = responses[valid]
+    valid_responses = int(valid.sum())
+    
+    # Find which category each role belongs to (the first category listing it wins)
+    role_categories = {}
+    for category, roles in role_mapping.items():
+        for role in roles:
+            role_categories.setdefault(role, category)
+    categories = responses['professional_role'].map(role_categories)
+    
+    # Count every (category, frequency) pair in one pass, in first-seen order
+    pair_counts = responses.groupby([categories, responses['level_generation_frequency']], sort=False).size()
+    for (category, frequency), count in pair_counts.items():
+        frequency_data[category][frequency] = int(count)
     
     # Ensure all frequency categories are represented with 0 if no responses
     for category in frequency_data.keys():
-        for freq in frequency_categories:
+        for freq in FREQUENCY_CATEGORIES:
             if freq not in frequency_data[category]:
                 frequency_data[category][freq] = 0
     
@@ -83,13 +100,17 @@ def extract_frequency_data(survey_data, role_mapping=None):
     print(f"Processed {valid_responses} valid survey responses")
     return frequency_data, totals
 
+# Response counts of one category as an array in FREQUENCY_CATEGORIES order
+def frequency_vector(responses):
+    return np.array([responses.get(label, 0) for label in FREQUENCY_CATEGORIES], dtype=float)
+
 def calculate_weighted_score(responses, weights, total_responses):
     """
     Calculate weighted score for a set of responses
     
     Args:
-        responses: dict with frequency labels as keys and counts as values
-        weights: dict with frequency labels as keys and weight values (0-1) as values
+        responses: response counts per frequency category, in FREQUENCY_CATEGORIES order
+        weights: weight values (0-1) per frequency category, in FREQUENCY_CATEGORIES order
         total_responses: total number of responses for percentage calculation
     
     Returns:
@@ -98,91 +119,49 @@ def calculate_weighted_score(responses, weights, total_responses):
     if total_responses == 0:
         return 0
         
-    weighted_sum = 0
-    for freq_label, count in responses.items():
-        if freq_label in weights:
-            percentage = count / total_responses
-            weighted_sum += weights[freq_label] * percentage
+    # The weighted sum is the dot product of the response shares and their weights
+    weighted_sum = float((responses / total_responses) @ weights)
     
     return weighted_sum * 100  # Convert to 0-100 scale
 
+# Round to one decimal with Python's round, which looks at the exact float value;
+# pandas/numpy round scale by 10 first and can tip a half-way score the other way
+def round_scores(values):
+    return values.map(lambda value: round(value, 1))
+
 # Analyze different scoring methodologies and compare results
 def analyze_scoring_methodologies(frequency_data, totals, categories_to_compare=['artists', 'designers']):
     
-    # Define different weighting schemes
-    weighting_schemes = {
-        "Original Linear": {
-            "Always (essential part of workflow)": 1.0,
-            "Often (most projects)": 0.75,
-            "Sometimes (about half of projects)": 0.5,
-            "Rarely (a few projects)": 0.25,
-            "Never": 0.0
-        },
-        
-        "Exponential Scale": {
-            "Always (essential part of workflow)": 1.0,
-            "Often (most projects)": 0.8,
-            "Sometimes (about half of projects)": 0.5,
-            "Rarely (a few projects)": 0.2,
-            "Never": 0.0
-        },
-        
-        "Adoption-Stage Based": {
-            "Always (essential part of workflow)": 1.0,
-            "Often (most projects)": 0.85,
-            "Sometimes (about half of projects)": 0.45,
-            "Rarely (a few projects)": 0.15,
-            "Never": 0.0
-        },
-        
-        "Domain-Specific": {
-            "Always (essential part of workflow)": 1.0,
-            "Often (most projects)": 0.7,
-            "Sometimes (about half of projects)": 0.4,
-            "Rarely (a few projects)": 0.1,
-            "Never": 0.0
-        },
-        
-        "Logarithmic": {
-            "Always (essential part of workflow)": 1.0,
-            "Often (most projects)": 0.69,
-            "Sometimes (about half of projects)": 0.41,
-            "Rarely (a few projects)": 0.18,
-            "Never": 0.0
-        }
-    }
-    
-    # Calculate scores for each methodology
-    results = []
-    for scheme_name, weights in weighting_schemes.items():
-        row = {'Scheme': scheme_name}
-        
-        # Calculate scores for each category
-        for category in categories_to_compare:
-            if category in frequency_data and totals[category] > 0:
-                score = calculate_weighted_score(
-                    frequency_data[category], 
-                    weights, 
-                    totals[category]
-                )
-                row[f'{category.title()} Score'] = round(score, 1)
-            else:
-                row[f'{category.title()} Score'] = 0
-        
-        # Calculate gap if comparing two categories
-        if len(categories_to_compare) == 2:
-            score1 = row[f'{categories_to_compare[0].title()} Score']
-            score2 = row[f'{categories_to_compare[1].title()} Score']
-            gap = score1 - score2
-            row['Gap'] = round(gap, 1)
-            if score1 > 0:
-                row['Gap %'] = round((gap / score1) * 100, 1)
-            else:
-                row['Gap %'] = 0
-        
-        results.append(row)
+    weighting_schemes = WEIGHTING_SCHEMES
     
-    return pd.DataFrame(results), weighting_schemes
+    # Calculate scores for every methodology and category at once from
+    # weights (scheme x frequency) and response shares (frequency x category)
+    weight_matrix = np.vstack(list(weighting_schemes.values()))
+    shares = np.zeros((len(FREQUENCY_CATEGORIES), len(categories_to_compare)))
+    for i, category in enumerate(categories_to_compare):
+        # Categories without responses score 0
+        if category in frequency_data and totals[category] > 0:
+            shares[:, i] = frequency_vector(frequency_data[category]) / totals[category]
+    # Accumulate one frequency at a time, Always to Never, like a running total:
+    # a matrix product sums in another order, which can move a score sitting on
+    # a rounding half-way point by 0.1
+    scores = np.zeros((len(weight_matrix), len(categories_to_compare)))
+    for weights, share in zip(weight_matrix.T, shares):
+        scores += weights[:, np.newaxis] * share
+    scores *= 100
+    
+    score_columns = [f'{category.title()} Score' for category in categories_to_compare]
+    results = round_scores(pd.DataFrame(scores, columns=score_columns))
+    results.insert(0, 'Scheme', list(weighting_schemes))
+    
+    # Calculate gap if comparing two categories
+    if len(categories_to_compare) == 2:
+        score1 = results[score_columns[0]]
+        gap = score1 - results[score_columns[1]]
+        results['Gap'] = round_scores(gap)
+        results['Gap %'] = round_scores(gap / score1.where(score1 > 0) * 100).fillna(0)
+    
+    return results, weighting_schemes
 
 # Create comprehensive visualizations with proper matplotlib handling
 def create_visualizations(df_results, frequency_data, totals, weighting_schemes, categories):
@@ -231,17 +210,9 @@ def create_visualizations(df_results, frequency_data, totals, weighting_schemes,
     # 3. Weight distributions
     ax3 = plt.subplot(2, 3, 3)
     freq_categories = ["Always", "Often", "Sometimes", "Rarely", "Never"]
-    full_categories = [
-        "Always (essential part of workflow)",
-        "Often (most projects)", 
-        "Sometimes (about half of projects)",
-        "Rarely (a few projects)",
-        "Never"
-    ]
     
     for i, (scheme_name, weights) in enumerate(list(weighting_schemes.items())[:3]):
-        weight_values = [weights[cat] for cat in full_categories]
-        ax3.plot(freq_categories, weight_values, marker='o', 
+        ax3.plot(freq_categories, weights, marker='o', 
                 label=scheme_name, linewidth=2)
     
     ax3.set_xlabel('Frequency Category')
@@ -256,9 +227,8 @@ def create_visualizations(df_results, frequency_data, totals, weighting_schemes,
         ax = plt.subplot(2, 3, 4 + i)
         
         if category in frequency_data and totals[category] > 0:
-            responses = frequency_data[category]
-            counts = [responses[cat] for cat in full_categories]
-            percentages = [count/totals[category]*100 for count in counts]
+            counts = frequency_vector(frequency_data[category])
+            percentages = counts/totals[category]*100
             
             x_bars = np.arange(len(freq_categories))  # FIXED: Use numeric positions
             bars = ax.bar(x_bars, percentages, alpha=0.8, color=colors[i])
@@ -281,21 +251,17 @@ def create_visualizations(df_results, frequency_data, totals, weighting_schemes,
     if len(categories) == 2 and all(cat in frequency_data for cat in categories):
         # Show how gap changes with different "Sometimes" weights
         sometimes_weights = np.linspace(0.2, 0.8, 20)
-        gaps = []
         
-        base_weights = weighting_schemes["Domain-Specific"].copy()
+        # One row of weights per tested "Sometimes" weight, scored in a single product
+        test_weights = np.tile(weighting_schemes["Domain-Specific"], (len(sometimes_weights), 1))
+        test_weights[:, FREQUENCY_INDEX["Sometimes (about half of projects)"]] = sometimes_weights
         
-        for weight in sometimes_weights:
-            test_weights = base_weights.copy()
-            test_weights["Sometimes (about half of projects)"] = weight
-            
-            score1 = calculate_weighted_score(
-                frequency_data[categories[0]], test_weights, totals[categories[0]]
-            )
-            score2 = calculate_weighted_score(
-                frequency_data[categories[1]], test_weights, totals[categories[1]]
-            )
-            gaps.append(score1 - score2)
+        shares = np.zeros((2, len(FREQUENCY_CATEGORIES)))
+        for i, category in enumerate(categories):
+            # Categories without responses score 0
+            if totals[category] > 0:
+                shares[i] = frequency_vector(frequency_data[category]) / totals[category]
+        gaps = 100.0 * test_weights @ (shares[0] - shares[1])
         
         ax6.plot(sometimes_weights, gaps, marker='o', linewidth=2, color='red')
         ax6.set_xlabel('"Sometimes" Weight')
@@ -368,16 +334,8 @@ def test_custom_weights(frequency_data, totals, categories):
     print("\n=== CUSTOM WEIGHT TESTER ===")
     print("Define your own weights (0.0 to 1.0) for each category:")
     
-    frequency_categories = [
-        "Always (essential part of workflow)",
-        "Often (most projects)", 
-        "Sometimes (about half of projects)",
-        "Rarely (a few projects)",
-        "Never"
-    ]
-    
     custom_weights = {}
-    for category in frequency_categories:
+    for category in FREQUENCY_CATEGORIES:
         while True:
             try:
                 weight = float(input(f"{category}: "))
@@ -393,20 +351,22 @@ def test_custom_weights(frequency_data, totals, categories):
     for cat, weight in custom_weights.items():
         print(f"  {cat}: {weight}")
     
+    weights = np.array([custom_weights[category] for category in FREQUENCY_CATEGORIES])
+    
     print(f"\nResults with your custom weights:")
     for category in categories:
         if category in frequency_data and totals[category] > 0:
             score = calculate_weighted_score(
-                frequency_data[category], custom_weights, totals[category]
+                frequency_vector(frequency_data[category]), weights, totals[category]
             )
             print(f"  {category.title()}: {score:.1f}")
     
     if len(categories) == 2:
         score1 = calculate_weighted_score(
-            frequency_data[categories[0]], custom_weights, totals[categories[0]]
+            frequency_vector(frequency_data[categories[0]]), weights, totals[categories[0]]
         )
         score2 = calculate_weighted_score(
-            frequency_data[categories[1]], custom_weights, totals[categories[1]]
+            frequency_vector(frequency_data[categories[1]]), weights, totals[categories[1]]
         )
         gap = score1 - score2
         gap_pct = (gap / score1 * 100) if score1 > 0 else 0
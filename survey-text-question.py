@@ -4,14 +4,19 @@ Using NetworkX built-in drawing functions with consistent plot styling
 """
 
 import json
+import re
 import matplotlib
+import numpy as np
 import pandas as pd
 import networkx as nx
 import matplotlib.pyplot as plt
-from collections import Counter, defaultdict
-from itertools import combinations
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # CONFIGURE MATPLOTLIB - CONSISTENT WITH OTHER PLOTS
 # ============================================================================
@@ -149,39 +154,53 @@ OFFSETS = {
 # ============================================================================
 
 def load_survey_data(filepath='procedural-level-generation-survey.json'):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    responses = []
-    for entry in data:
-        response = entry.get('most_important_problem')
-        if response and response.strip():
-            responses.append({
-                'id': entry.get('id'),
-                'response': response.strip(),
-                'role': entry.get('professional_role'),
-                'experience': entry.get('years_experience')
-            })
+    # Parse with orjson when it is installed and handle the answers as columns
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    entries = pd.DataFrame(data).reindex(columns=['id', 'most_important_problem', 'professional_role', 'years_experience'])
+    
+    # Keep the non-blank text answers, stripped
+    answers = entries['most_important_problem']
+    answers = answers.where(answers.map(type).eq(str)).str.strip()
+    entries = entries.assign(most_important_problem=answers)[answers.fillna('').ne('')]
+    entries = entries.rename(columns={'most_important_problem': 'response', 'professional_role': 'role',
+                                      'years_experience': 'experience'})
+    # Missing fields are None, as dict.get returned them
+    entries = entries.astype(object).where(entries.notna(), None)
+    responses = entries.to_dict('records')
     
     print(f"✓ Loaded {len(responses)} open-ended responses from {len(data)} total entries")
     return responses
 
+def compile_theme_patterns(themes=THEMES):
+    """One regex alternation of the escaped keywords per theme, longest keywords first.
+    A theme without keywords gets a pattern that never matches."""
+    return {
+        theme: re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)) or '(?!)')
+        for theme, keywords in themes.items()
+    }
+
+# Patterns of the default themes, compiled once at import
+THEME_PATTERNS = compile_theme_patterns(THEMES)
+
+def get_theme_patterns(themes=THEMES):
+    return THEME_PATTERNS if themes is THEMES else compile_theme_patterns(themes)
+
 def code_response(response_text, themes=THEMES):
     response_lower = response_text.lower()
-    found_themes = []
-    
-    for theme, keywords in themes.items():
-        for keyword in keywords:
-            if keyword in response_lower:
-                found_themes.append(theme)
-                break
-    
-    return found_themes
+    return [theme for theme, pattern in get_theme_patterns(themes).items()
+            if pattern.search(response_lower)]
 
 def perform_thematic_coding(responses, themes=THEMES):
+    # Scan all responses for one theme at a time instead of every keyword per response
+    texts = pd.Series([resp['response'] for resp in responses], dtype=object).str.lower()
+    matches = pd.DataFrame({theme: texts.str.contains(pattern)
+                            for theme, pattern in get_theme_patterns(themes).items()},
+                           index=texts.index, columns=list(themes))
+    
     coded_data = []
-    for resp in responses:
-        themes_found = code_response(resp['response'], themes)
+    for resp, hits in zip(responses, matches.to_numpy(dtype=bool)):
+        themes_found = matches.columns[hits].tolist()
         coded_data.append({
             **resp,
             'themes': themes_found,
@@ -190,41 +209,30 @@ def perform_thematic_coding(responses, themes=THEMES):
     return coded_data
 
 def calculate_theme_stats(coded_data):
-    all_themes = []
-    for entry in coded_data:
-        all_themes.extend(entry['themes'])
+    themes = pd.Series([entry['themes'] for entry in coded_data], dtype=object)
     
-    theme_counts = Counter(all_themes)
-    total_responses = len([e for e in coded_data if e['themes']])
-    
-    stats = []
-    for theme, count in theme_counts.most_common():
-        stats.append({
-            'theme': theme,
-            'count': count,
-            'percentage': (count / total_responses) * 100
-        })
+    # Most common first; ties keep the order in which the themes first appear
+    theme_counts = themes.explode().dropna().value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    total_responses = int(themes.map(bool).sum())
     
-    return pd.DataFrame(stats)
+    return pd.DataFrame({
+        'theme': theme_counts.index.tolist(),
+        'count': theme_counts.to_numpy(),
+        'percentage': (theme_counts.to_numpy() / total_responses) * 100
+    })
 
 def calculate_cooccurrence_matrix(coded_data):
-    cooccurrence = defaultdict(lambda: defaultdict(int))
-    
-    for entry in coded_data:
-        themes = entry['themes']
-        if len(themes) > 1:
-            for theme1, theme2 in combinations(sorted(themes), 2):
-                cooccurrence[theme1][theme2] += 1
-                cooccurrence[theme2][theme1] += 1
-    
     all_themes = sorted(set(theme for entry in coded_data for theme in entry['themes']))
-    matrix = pd.DataFrame(0, index=all_themes, columns=all_themes)
+    theme_index = {theme: i for i, theme in enumerate(all_themes)}
     
-    for theme1 in cooccurrence:
-        for theme2 in cooccurrence[theme1]:
-            matrix.loc[theme1, theme2] = cooccurrence[theme1][theme2]
+    # One-hot response x theme membership; M.T @ M counts the responses sharing each theme pair
+    membership = np.zeros((len(coded_data), len(all_themes)), dtype=np.int64)
+    for i, entry in enumerate(coded_data):
+        membership[i, [theme_index[theme] for theme in entry['themes']]] = 1
+    cooccurrence = membership.T @ membership
+    np.fill_diagonal(cooccurrence, 0)
     
-    return matrix
+    return pd.DataFrame(cooccurrence, index=all_themes, columns=all_themes)
 
 def create_network_graph(theme_stats, cooccurrence_matrix, min_cooccurrence=1):
     G = nx.Graph()
@@ -363,8 +371,9 @@ def visualize_network(
     
     # Save with optional cropping
     if crop == 'axes':
-        # Crop to axes content
-        fig.canvas.draw()  # ensure renderer exists
+        # Crop to axes content. Only the layout is needed to measure it, the real
+        # rendering happens once in savefig, so skip rasterizing the figure here.
+        fig.draw_without_rendering()
         bbox = ax.get_tightbbox(fig.canvas.get_renderer()).transformed(
             fig.dpi_scale_trans.inverted()
         )
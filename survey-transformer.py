@@ -1,13 +1,50 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import numpy as np
+import codecs
 import json
+import textwrap
+
+# Number of bytes read from the start of the CSV to detect its encoding
+ENCODING_SAMPLE_SIZE = 1 << 16
+
+# Detect the CSV encoding from a sample of its first bytes, so the file is parsed only once.
+# UTF-8 with or without a BOM is recognised directly, anything else is left to chardet when
+# installed and otherwise read as cp1252, the usual encoding of spreadsheet exports.
+def detect_encoding(csv_file, sample_size=ENCODING_SAMPLE_SIZE):
+    with open(csv_file, 'rb') as f:
+        sample = f.read(sample_size)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # Not final: the sample may end in the middle of a multi-byte character
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    try:
+        import chardet
+    except ImportError:
+        return 'cp1252'
+    return chardet.detect(sample)['encoding'] or 'cp1252'
 
 class survey_transformer:
-    def __init__(self, csv_file, schema_file):
-        self.parsed_data = pd.read_csv(csv_file)
+    # Pass chunksize to read and transform the CSV that many rows at a time,
+    # save() then streams each chunk to the output instead of holding the whole survey.
+    # Pass max_workers to transform the questions on a thread pool instead of one after another.
+    def __init__(self, csv_file, schema_file, chunksize=None, max_workers=None):
+        self.csv_file = csv_file
+        self.chunksize = chunksize
+        self.max_workers = max_workers
+        self.encoding = detect_encoding(csv_file)
+        self.parsed_data = None
+        if chunksize is None:
+            self.parsed_data = pd.read_csv(csv_file, engine='pyarrow', dtype='string[pyarrow]',
+                                           encoding=self.encoding)
         self.transformed_data = []    
         self.questions = {}
+        self._cleaned_columns = {}  # CSV column name -> cleaned values, see _clean_column
         
         # Load schema and build questions mapping
         self._load_schema(schema_file)
@@ -24,17 +61,27 @@ class survey_transformer:
             # Map key to question text for all question types
             self.questions[key] = question_info.get('question', '')
     
-    # Clean value by removing escape sequences and extra whitespace
-    def _clean_value(self, value):
-        if pd.isna(value):
-            return None
-        
-        cleaned = str(value).strip()
+    # Clean a column of strings by removing escape sequences and extra whitespace
+    def _clean_text(self, text):
+        text = text.str.strip()
         # Remove escape sequences like \"
-        cleaned = cleaned.replace('"', '')
-        cleaned = cleaned.replace('(not as well-known term) ', '')
-        
-        return cleaned
+        text = text.str.replace('"', '', regex=False)
+        text = text.str.replace('(not as well-known term) ', '', regex=False)
+        return text
+
+    # Clean a whole CSV column at once, missing values become None.
+    # Results are cached per column, callers must copy before modifying them.
+    def _clean_column(self, column_name):
+        if column_name not in self._cleaned_columns:
+            column = self.parsed_data[column_name].reset_index(drop=True)
+            present = column.notna()
+            # The column is already read as Arrow strings, so clean it in place without converting
+            cleaned = self._clean_text(column[present])
+
+            values = np.full(len(column), None, dtype=object)
+            values[present.to_numpy()] = cleaned.to_numpy(dtype=object)
+            self._cleaned_columns[column_name] = (values, cleaned)
+        return self._cleaned_columns[column_name]
     
     # Get question info from schema
     def _get_question_info(self, key):
@@ -43,70 +90,175 @@ class survey_transformer:
     # Find CSV columns that match matrix question pattern
     def _find_matrix_columns(self, base_question, items):
         matching_columns = {}
-        csv_columns = self.parsed_data.columns.tolist()
+        # Only columns for this question can match an item, so narrow them down once
+        csv_columns = [col for col in self.parsed_data.columns if base_question in col]
         
         for item in items:
             for col in csv_columns:
-                if base_question in col and item in col:
+                if item in col:
                     matching_columns[item] = col
                     break
         return matching_columns
 
+    # Resolve every question to its type and CSV column(s) in a single pass over the schema
+    def _resolve_columns(self):
+        layout = {}
+        for key, question in self.questions.items():
+            question_info = self._get_question_info(key)
+            question_type = question_info.get('type', '')
+            if question_type == 'matrix':
+                items = question_info.get('items', [])
+                columns = self._find_matrix_columns(question, items) if items else None
+            else:
+                columns = question
+            layout[key] = (question_type, columns)
+        return layout
+
+    # Transform a single answer column (identifier, single_choice, open_text) into a list of values
+    def _transform_single(self, column_name, row_count):
+        if column_name not in self.parsed_data.columns:
+            return [None] * row_count
+        return self._clean_column(column_name)[0].tolist()
+
+    # Transform a multiple choice or ranking column, splitting the semicolon-separated answers into lists
+    def _transform_multi(self, column_name, row_count):
+        if column_name not in self.parsed_data.columns:
+            return [None] * row_count
+        values, cleaned = self._clean_column(column_name)
+        values = values.copy()
+
+        multi = cleaned[cleaned.str.contains(';', regex=False)]
+        # Clean each part of the semicolon-separated list and remove empty parts
+        parts = self._clean_text(multi.str.split(';').explode())
+        parts = parts[parts != '']
+        lists = parts.groupby(level=0, sort=False).agg(list).reindex(multi.index)
+        for position, part_list in zip(multi.index, lists):
+            values[position] = part_list if isinstance(part_list, list) else []
+
+        return values.tolist()
+
+    # Transform the item columns of a matrix question into one dict per row
+    def _transform_matrix(self, columns, row_count):
+        if columns is None:
+            return [None] * row_count
+        if not columns:
+            return [{} for _ in range(row_count)]
+        items = list(columns.keys())
+        item_values = [self._clean_column(column_name)[0].tolist()
+                       for column_name in columns.values()]
+        return [dict(zip(items, row)) for row in zip(*item_values)]
+
+    # Question type -> transform method, any other type is read as a single answer column
+    _transformers = {
+        'matrix': _transform_matrix,
+        'multiple_choice': _transform_multi,
+        'ranking': _transform_multi,
+    }
+
+    # Yield the CSV as data frames, the whole file at once unless a chunksize was given
+    def _read_chunks(self):
+        if self.chunksize is None:
+            yield self.parsed_data
+            return
+        # The pyarrow engine cannot read in chunks, so use the default parser here
+        for chunk in pd.read_csv(self.csv_file, dtype='string[pyarrow]', encoding=self.encoding,
+                                 chunksize=self.chunksize):
+            yield chunk
+
+    # Yield the transformed rows of each chunk in turn
+    def _transform_chunks(self):
+        for chunk in self._read_chunks():
+            if chunk is not self.parsed_data:
+                self.parsed_data = chunk
+                self._cleaned_columns = {}
+            yield self._transform_rows()
+
     def transform(self):
-        self.transformed_data = []
-        for index, row in self.parsed_data.iterrows():
-            transformed_row = {}
-
-            # go through each question and map it to the corresponding column in the CSV
-            for key, question in self.questions.items():
-                question_info = self._get_question_info(key)
-                question_type = question_info.get('type', '')
-                
-                if question_type == 'matrix':
-                    # Handle matrix questions
-                    items = question_info.get('items', [])
-                    if items:
-                        matrix_data = {}
-                        matrix_columns = self._find_matrix_columns(question, items)
-                        
-                        for item, column_name in matrix_columns.items():
-                            if column_name in row:
-                                value = row[column_name]
-                                cleaned_value = self._clean_value(value)
-                                matrix_data[item] = cleaned_value
-                            else:
-                                matrix_data[item] = None
-                        
-                        transformed_row[key] = matrix_data
-                    else:
-                        transformed_row[key] = None
-                        
-                else:
-                    # Handle regular questions (identifier, single_choice, multiple_choice, ranking, open_text)
-                    if question in row:
-                        value = row[question]
-                        cleaned_value = self._clean_value(value)
-                        
-                        if cleaned_value is None:
-                            transformed_row[key] = None
-                        else:
-                            # Handle multiple choice and ranking questions (semicolon-separated values)
-                            if question_type in ['multiple_choice', 'ranking'] and ';' in cleaned_value:
-                                # Clean each part of the semicolon-separated list
-                                parts = [self._clean_value(part) for part in cleaned_value.split(';')]
-                                transformed_row[key] = [part for part in parts if part]  # Remove empty parts
-                            else:
-                                transformed_row[key] = cleaned_value
-                    else:
-                        transformed_row[key] = None
-            
-            self.transformed_data.append(transformed_row)
+        self.transformed_data = [row for rows in self._transform_chunks() for row in rows]
+
+    # Transform the currently loaded rows into a list of row dicts
+    def _transform_rows(self):
+        layout = self._resolve_columns()
+        row_count = len(self.parsed_data)
+
+        # go through each question and map it to the corresponding column(s) in the CSV
+        def transform_question(question):
+            question_type, columns = question
+            transform = self._transformers.get(question_type, survey_transformer._transform_single)
+            return transform(self, columns, row_count)
+
+        if self.max_workers:
+            # Questions are independent and the Arrow string kernels release the GIL,
+            # but the per-row list building does not, so this only pays off on large surveys
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                question_values = list(executor.map(transform_question, layout.values()))
+        else:
+            question_values = [transform_question(question) for question in layout.values()]
+
+        keys = list(layout.keys())
+        return [dict(zip(keys, row)) for row in zip(*question_values)]
 
     
+    # Build an Arrow table of the transformed responses, typed from the schema.
+    # The schema itself travels in the table metadata, see SurveyAnalyzer.from_arrow
+    def to_arrow(self):
+        import pyarrow as pa
+
+        columns = {}
+        scalar_rows = {}
+        for key in self.questions:
+            question_type = self._get_question_info(key).get('type', '')
+            values = [row.get(key) for row in self.transformed_data]
+            if question_type in ['multiple_choice', 'ranking']:
+                # Arrow columns are homogeneous, so answers without a semicolon are stored as
+                # one-item lists and their rows recorded so readers can restore them
+                scalar_rows[key] = [i for i, value in enumerate(values) if isinstance(value, str)]
+                values = [[value] if isinstance(value, str) else value for value in values]
+                columns[key] = pa.array(values, type=pa.list_(pa.string()))
+            elif question_type == 'matrix':
+                # Matrix answers become a struct with one field per item
+                columns[key] = pa.array(values) if any(values) else pa.nulls(len(values))
+            else:
+                columns[key] = pa.array(values, type=pa.string())
+        metadata = {'scalar_rows': json.dumps(scalar_rows), 'schema': json.dumps(self.schema)}
+        return pa.table(columns, metadata=metadata)
+
+    # Save as Parquet, a columnar alternative to the JSON output for downstream analysis
+    def save_parquet(self, parquet_file):
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), parquet_file, compression='zstd')
+        print(f"Data saved to {parquet_file}")
+
+    # Save as an Arrow IPC file, which the analyzer memory-maps instead of parsing
+    def save_arrow(self, arrow_file):
+        import pyarrow as pa
+
+        table = self.to_arrow()
+        with pa.OSFile(arrow_file, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        print(f"Data saved to {arrow_file}")
+
     def save(self, transformed_file):
-        with open(transformed_file, 'w') as f:
-            json.dump(self.transformed_data, f, indent=4)
-        print(f"Data saved to {transformed_file}")    
+        # json.dump streams the encoded chunks; a large buffer batches them into few writes
+        with open(transformed_file, 'w', buffering=1 << 20) as f:
+            if self.chunksize is None:
+                json.dump(self.transformed_data, f, indent=4)
+            else:
+                self._save_chunks(f)
+        print(f"Data saved to {transformed_file}")
+
+    # Transform and write one chunk at a time, laid out exactly like json.dump(..., indent=4)
+    def _save_chunks(self, f):
+        separator = '[\n'
+        for rows in self._transform_chunks():
+            for row in rows:
+                f.write(separator)
+                f.write(textwrap.indent(json.dumps(row, indent=4), '    '))
+                separator = ',\n'
+        f.write('[]' if separator == '[\n' else '\n]')
 
 def main():
     print("📊 Survey Transformer v14.0 (Schema-Driven)\n")
@@ -1,7 +1,7 @@
 """
 SurveyAnalyzer - A Python tool for analyzing survey data with flexible filtering
 
-This script loads survey questions from a schema (JSON) and answers (JSON),
+This script loads survey questions from a schema (JSON) and answers (JSON, Parquet or Arrow IPC),
 and allows for filtering based on question responses with AND/OR logic.
 Results can be used for plotting and analysis.
 
@@ -19,8 +19,11 @@ from typing import Dict, List, Any, Optional, Union, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from collections import Counter
+from functools import lru_cache
 
-# Helper function for smart label wrapping
+# Helper function for smart label wrapping.
+# Plots wrap the same option and item labels over and over, so results are cached.
+@lru_cache(maxsize=None)
 def wrap_label_smart(label: str, width: Optional[int], max_length: int = 78) -> str:
     """Wrap labels based on width setting: None=no wrapping, 0=wrap at slashes, >0=wrap at width"""
     # First, truncate if label is too long
@@ -48,6 +51,13 @@ def wrap_label_smart(label: str, width: Optional[int], max_length: int = 78) ->
             wrapped = '\n'.join([lines[0], truncated_second])
         return wrapped
 
+# Order labels found in the data the way the schema lists them, with any labels the schema
+# does not know (like 'Other') sorted at the end. Index set operations replace the Python loops.
+def order_by_schema(found, schema_order: List[str]) -> List[str]:
+    found = pd.Index(list(found))
+    schema = pd.Index(schema_order).drop_duplicates()
+    return schema[schema.isin(found)].tolist() + found.difference(schema).sort_values().tolist()
+
 # Enum for filter logic operations
 class FilterLogic(Enum):
     AND = "AND"
@@ -68,7 +78,9 @@ class Filter:
 # and data extraction from survey responses.
 class SurveyAnalyzer:    
     # Initialize the SurveyAnalyzer with schema and data files.
-    def __init__(self, schema_path: str, data_path: str, mapping_path: Optional[str] = None):
+    # Set verbose to print a status line for every filter operation.
+    def __init__(self, schema_path: str, data_path: str, mapping_path: Optional[str] = None,
+                 verbose: bool = False):
         self.schema_path = schema_path
         self.data_path = data_path
         self.mapping_path = mapping_path
@@ -79,9 +91,29 @@ class SurveyAnalyzer:
         self.filters: List[Filter] = []
         self.filter_logic = FilterLogic.AND
         self.option_mappings: Dict[str, str] = {}  # Flattened mapping from full text to short text
+        self.verbose = verbose
         
         self._load_data()
     
+    # Create an analyzer directly from an Arrow table built by survey_transformer.to_arrow,
+    # skipping the JSON round trip. The schema defaults to the one stored in the table metadata.
+    @classmethod
+    def from_arrow(cls, table, schema: Optional[Dict[str, Any]] = None,
+                   mapping_path: Optional[str] = None, verbose: bool = False) -> 'SurveyAnalyzer':
+        if schema is None:
+            schema = json.loads((table.schema.metadata or {})[b'schema'])
+        
+        analyzer = cls.__new__(cls)
+        analyzer.schema_path = None
+        analyzer.data_path = None
+        analyzer.mapping_path = mapping_path
+        analyzer.filters = []
+        analyzer.filter_logic = FilterLogic.AND
+        analyzer.option_mappings = {}
+        analyzer.verbose = verbose
+        analyzer._set_data(schema, cls._responses_from_arrow(table))
+        return analyzer
+    
     # Load and flatten the option mappings from the mapping file
     def _load_option_mappings(self) -> None:
         if not self.mapping_path:
@@ -115,55 +147,98 @@ class SurveyAnalyzer:
         except Exception as e:
             print(f"Warning: Error loading mapping file: {e}")
     
-    # Load schema and survey response data from JSON files. Non-standard answers are stored as 'Other'.
+    # Load schema and survey response data from JSON files (or Parquet/Arrow response files)
     def _load_data(self) -> None:
         try:
             with open(self.schema_path, 'r', encoding='utf-8') as f:
-                self.schema = json.load(f)
-
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                raw_responses = json.load(f)
-
-            # Load option mappings first
-            self._load_option_mappings()
+                schema = json.load(f)
 
-            # Clean responses: replace non-standard answers with 'Other'
-            cleaned_responses = []
-            if self.schema is not None:
-                for response in raw_responses:
-                    cleaned = response.copy()
-                    for q_key, q_info in self.schema['questions'].items():
-                        options = q_info.get('options', [])
-                        q_type = q_info.get('type', '')
-                        if q_key in cleaned:
-                            val = cleaned[q_key]
-                            if options:
-                                if q_type == 'multiple_choice' and isinstance(val, list):
-                                    cleaned[q_key] = [v if v in options else 'Other' for v in val]
-                                elif q_type == 'single_choice' and isinstance(val, str):
-                                    if val not in options:
-                                        cleaned[q_key] = 'Other'
-                                # For other types, leave as is
-                    cleaned_responses.append(cleaned)
+            if self.data_path.endswith('.parquet'):
+                raw_responses = self._read_parquet_responses()
+            elif self.data_path.endswith('.arrow'):
+                raw_responses = self._read_arrow_responses()
             else:
-                cleaned_responses = raw_responses
-
-            # Apply option mappings to replace long text with short versions
-            # mapped_responses = self._apply_option_mappings(cleaned_responses)
-
-            self.responses = cleaned_responses
-            self.df = pd.DataFrame(self.responses)
-            self.filtered_data = self.df.copy()
+                with open(self.data_path, 'r', encoding='utf-8') as f:
+                    raw_responses = json.load(f)
 
-            if self.responses and self.schema:
-                print(f"Loaded {len(self.responses)} survey responses")
-                print(f"Available questions: {list(self.schema['questions'].keys())}")
+            self._set_data(schema, raw_responses)
 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Could not find file: {e}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {e}")
     
+    # Store the schema and responses. Non-standard answers are stored as 'Other'.
+    def _set_data(self, schema: Dict[str, Any], raw_responses: List[Dict[str, Any]]) -> None:
+        self.schema = schema
+
+        # Load option mappings first
+        self._load_option_mappings()
+
+        # Clean responses: replace non-standard answers with 'Other'
+        cleaned_responses = []
+        if self.schema is not None:
+            # Only choice questions with predefined options are cleaned, other types are left as is
+            choice_options = {
+                q_key: (q_info.get('type', ''), frozenset(q_info['options']))
+                for q_key, q_info in self.schema['questions'].items()
+                if q_info.get('options') and q_info.get('type', '') in ('multiple_choice', 'single_choice')
+            }
+            for response in raw_responses:
+                cleaned = response.copy()
+                for q_key, (q_type, options) in choice_options.items():
+                    if q_key in cleaned:
+                        val = cleaned[q_key]
+                        if q_type == 'multiple_choice' and isinstance(val, list):
+                            cleaned[q_key] = [v if v in options else 'Other' for v in val]
+                        elif q_type == 'single_choice' and isinstance(val, str):
+                            if val not in options:
+                                cleaned[q_key] = 'Other'
+                cleaned_responses.append(cleaned)
+        else:
+            cleaned_responses = raw_responses
+
+        # Apply option mappings to replace long text with short versions
+        # mapped_responses = self._apply_option_mappings(cleaned_responses)
+
+        self.responses = cleaned_responses
+        self.df = pd.DataFrame(self.responses)
+        self.filtered_data = self.df.copy()
+        # (question, filter key) -> counts, see get_question_counts
+        self._counts_cache: Dict[tuple, Dict[str, int]] = {}
+
+        if self.responses and self.schema:
+            print(f"Loaded {len(self.responses)} survey responses")
+            if self.verbose:
+                print(f"Available questions: {list(self.schema['questions'].keys())}")
+    
+    # Convert an Arrow table built by survey_transformer.to_arrow back into response dicts
+    @staticmethod
+    def _responses_from_arrow(table) -> List[Dict[str, Any]]:
+        responses = table.to_pylist()
+
+        # Answers stored as one-item lists that were plain strings in the JSON output
+        metadata = table.schema.metadata or {}
+        scalar_rows = json.loads(metadata.get(b'scalar_rows', b'{}'))
+        for key, rows in scalar_rows.items():
+            for i in rows:
+                responses[i][key] = responses[i][key][0]
+        return responses
+
+    # Read responses from a Parquet file written by survey_transformer.save_parquet
+    def _read_parquet_responses(self) -> List[Dict[str, Any]]:
+        import pyarrow.parquet as pq
+
+        return self._responses_from_arrow(pq.read_table(self.data_path))
+
+    # Read responses from an Arrow IPC file written by survey_transformer.save_arrow, memory-mapped
+    def _read_arrow_responses(self) -> List[Dict[str, Any]]:
+        import pyarrow as pa
+
+        with pa.memory_map(self.data_path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        return self._responses_from_arrow(table)
+    
     # Ensure data is loaded, raise error if not
     def _ensure_loaded(self) -> None:
         if self.schema is None or self.responses is None or self.df is None:
@@ -205,13 +280,15 @@ class SurveyAnalyzer:
         
         filter_obj = Filter(question=question, value=value, negate=negate)
         self.filters.append(filter_obj)
-        print(f"Added filter: {filter_obj}")
+        if self.verbose:
+            print(f"Added filter: {filter_obj}")
     
     # Remove a filter by index
     def remove_filter(self, index: int) -> None:
         if 0 <= index < len(self.filters):
             removed_filter = self.filters.pop(index)
-            print(f"Removed filter: {removed_filter}")
+            if self.verbose:
+                print(f"Removed filter: {removed_filter}")
         else:
             raise IndexError(f"Filter index {index} out of range")
     
@@ -222,7 +299,8 @@ class SurveyAnalyzer:
         
         self.filters.clear()
         self.filtered_data = self.df.copy()
-        print("All filters cleared")
+        if self.verbose:
+            print("All filters cleared")
     
     # Set the logic for combining multiple filters
     def set_filter_logic(self, logic: Union[FilterLogic, str]) -> None:
@@ -230,7 +308,8 @@ class SurveyAnalyzer:
             logic = FilterLogic(logic.upper())
         
         self.filter_logic = logic
-        print(f"Filter logic set to: {logic.value}")
+        if self.verbose:
+            print(f"Filter logic set to: {logic.value}")
     
     # Apply all current filters to the data and return filtered DataFrame
     def apply_filters(self) -> pd.DataFrame:
@@ -241,10 +320,9 @@ class SurveyAnalyzer:
             self.filtered_data = self.df.copy()
             return self.filtered_data
         
-        def check_filter(row: pd.Series, filter_obj: Filter) -> bool:
-            """Check if a row matches a single filter."""
-            response_value = row[filter_obj.question]
-            
+        def check_filter(response_value: Any, filter_obj: Filter) -> bool:
+            """Check if a response value matches a single filter."""
+
             # Handle multiple choice questions (arrays)
             if isinstance(response_value, list):
                 if isinstance(filter_obj.value, list):
@@ -265,28 +343,29 @@ class SurveyAnalyzer:
             # Apply negation if specified
             return not match if filter_obj.negate else match
         
-        if self.filter_logic == FilterLogic.AND:
-            # All filters must match
-            mask = self.df.apply(
-                lambda row: all(check_filter(row, f) for f in self.filters), 
-                axis=1
-            )
-        else:  # OR logic
-            # At least one filter must match
-            mask = self.df.apply(
-                lambda row: any(check_filter(row, f) for f in self.filters), 
-                axis=1
-            )
+        # Only the filtered questions are needed, read them as plain tuples per row
+        combine = all if self.filter_logic == FilterLogic.AND else any  # AND: all filters must match, OR: at least one
+        rows = self.df[[f.question for f in self.filters]].itertuples(index=False, name=None)
+        mask = pd.Series(
+            [combine(check_filter(value, f) for value, f in zip(row, self.filters)) for row in rows],
+            index=self.df.index, dtype=bool
+        )
         
         self.filtered_data = self.df[mask]
         
-        print(f"Applied {len(self.filters)} filter(s) with {self.filter_logic.value} logic")
-        print(f"Filtered data: {len(self.filtered_data)} responses (from {len(self.df)} total)")
+        if self.verbose:
+            print(f"Applied {len(self.filters)} filter(s) with {self.filter_logic.value} logic\n"
+                  f"Filtered data: {len(self.filtered_data)} responses (from {len(self.df)} total)")
         
         return self.filtered_data
     
     # Get all values for a specific question from the (optionally filtered) data
     def get_question_values(self, question: str, filtered: bool = True) -> List[Any]:
+        return self._get_question_series(question, filtered).tolist()
+    
+    # Same as get_question_values, but keeps the values in a Series so counting
+    # them does not go through a Python list and back
+    def _get_question_series(self, question: str, filtered: bool = True) -> pd.Series:
         self._ensure_loaded()
         assert self.schema is not None and self.df is not None and self.filtered_data is not None
 
@@ -302,53 +381,60 @@ class SurveyAnalyzer:
 
         if question not in data.columns:
             print(f"Warning: Question '{question}' not found in response data")
-            return []
+            return pd.Series(dtype=object)
 
         # Handle missing values
-        values = data[question].dropna().tolist()
+        column = data[question].dropna()
 
         # Flatten if this is a multiple choice question with arrays
+        # (explode turns empty lists into NaN, so drop those again)
         question_type = self.get_question_type(question)
         if question_type == 'multiple_choice':
-            flattened_values = []
-            for value in values:
-                if isinstance(value, list):
-                    flattened_values.extend(value)
-                else:
-                    flattened_values.append(value)
-            values = flattened_values
+            column = column.explode().dropna()
 
-        return values
+        return column
+    
+    # Hashable description of the active filters, empty when no filter is set
+    def _filter_key(self) -> tuple:
+        if not self.filters:
+            return ()
+        return (self.filter_logic,) + tuple(
+            (f.question, tuple(f.value) if isinstance(f.value, list) else f.value, f.negate)
+            for f in self.filters
+        )
     
-    # Get count distribution for a specific question
+    # Get count distribution for a specific question.
+    # Charts ask for the same question under the same filters over and over (every role stacked
+    # chart recounts each role), so counts are computed once per question and filter set.
     def get_question_counts(self, question: str, filtered: bool = True, group_other: bool = False) -> Dict[str, int]:
-        values = self.get_question_values(question, filtered)
+        cache_key = (question, self._filter_key() if filtered else ())
+        if cache_key in self._counts_cache:
+            return dict(self._counts_cache[cache_key])
+        
+        values = self._get_question_series(question, filtered)
         
         # Handle matrix-type questions separately
         question_type = self.get_question_type(question)
         if question_type == 'matrix':
-            # For matrix questions, flatten the dictionary responses
-            flattened_values = []
-            for value in values:
-                if isinstance(value, dict):
-                    # Extract all the individual responses from the matrix
-                    for item, rating in value.items():
-                        if rating is not None:
-                            flattened_values.append(f"{item}: {rating}")
-                else:
-                    flattened_values.append(str(value))
-            values = flattened_values
+            # For matrix questions, flatten the dictionary responses to "item: rating"
+            # entries and keep anything else as is, in response order
+            values = values.reset_index(drop=True)
+            is_matrix = values.map(type).eq(dict)
+            ratings = self._stack_matrix_ratings(values[is_matrix])
+            items = ratings.index.get_level_values(1).map(str)
+            matrix_strs = pd.Series(items + ': ' + ratings.map(str).to_numpy(), index=ratings.index.droplevel(1))
+            value_strs = pd.concat([matrix_strs, values[~is_matrix].map(str)]).sort_index(kind='stable')
+        else:
+            # Multiple choice answers are already exploded to one selection per entry
+            value_strs = values.map(str)
         
         # Count occurrences while preserving schema order
         # First get the expected order from schema
         question_info = self.get_question_info(question)
         schema_options = question_info.get('options', [])
         
-        # Count all occurrences
-        raw_counts = {}
-        for value in values:
-            value_str = str(value) if not isinstance(value, str) else value
-            raw_counts[value_str] = raw_counts.get(value_str, 0) + 1
+        # Count all occurrences in one hash-table pass (keeps first-seen order)
+        raw_counts = value_strs.value_counts(sort=False).to_dict()
         
         # Build ordered, mapped counts dictionary
         counts = {}
@@ -365,11 +451,12 @@ class SurveyAnalyzer:
             if mapped_value not in counts:
                 counts[mapped_value] = count
         
-        return counts
+        self._counts_cache[cache_key] = counts
+        return dict(counts)
     
     # Get count distribution for matrix-type questions, organized by item and rating
     def get_matrix_counts(self, question: str, filtered: bool = True) -> Dict[str, Dict[str, int]]:
-        values = self.get_question_values(question, filtered)
+        values = self._get_question_series(question, filtered)
         
         # Verify this is a matrix question
         question_type = self.get_question_type(question)
@@ -378,20 +465,28 @@ class SurveyAnalyzer:
         
         matrix_counts = {}
         
-        for value in values:
-            if isinstance(value, dict):
-                for item, rating in value.items():
-                    if rating is not None:
-                        mapped_item = self._get_mapped_option(item)
-                        mapped_rating = self._get_mapped_option(str(rating))
-                        
-                        if mapped_item not in matrix_counts:
-                            matrix_counts[mapped_item] = {}
-                        
-                        matrix_counts[mapped_item][mapped_rating] = matrix_counts[mapped_item].get(mapped_rating, 0) + 1
+        ratings = self._stack_matrix_ratings(values[values.map(type).eq(dict)])
+        for (_, item), rating in ratings.items():
+            mapped_item = self._get_mapped_option(item)
+            mapped_rating = self._get_mapped_option(str(rating))
+            
+            if mapped_item not in matrix_counts:
+                matrix_counts[mapped_item] = {}
+            
+            matrix_counts[mapped_item][mapped_rating] = matrix_counts[mapped_item].get(mapped_rating, 0) + 1
         
         return matrix_counts
     
+    # Spread matrix answers (one dict per response) into a Series indexed by (response, item),
+    # in answer order, with the unanswered items dropped by one mask instead of a check per rating
+    @staticmethod
+    def _stack_matrix_ratings(answers: pd.Series) -> pd.Series:
+        if answers.empty:
+            return pd.Series(dtype=object, index=pd.MultiIndex.from_tuples([], names=[None, None]))
+        rows = pd.DataFrame(answers.tolist(), index=answers.index, dtype=object)
+        ratings = rows.stack()
+        return ratings[ratings.notna()]
+    
     # Get weighted scores for ranking-type questions
     def get_ranking_scores(self, question: str, filtered: bool = True, max_rank: int = 3) -> Dict[str, float]:
         values = self.get_question_values(question, filtered)
@@ -462,16 +557,22 @@ class SurveyAnalyzer:
 
 
 def get_colors(colormap_name: str, num_colors: int = 20) -> List[Tuple[float, float, float, float]]:
+    return list(_sample_colors(colormap_name, num_colors))
+
+# Charts keep asking for the same few colormaps, so the sampled colors are cached.
+# Checking the name against plt.colormaps() alone builds a list of every registered colormap.
+@lru_cache(maxsize=32)
+def _sample_colors(colormap_name: str, num_colors: int) -> Tuple[Tuple[float, float, float, float], ...]:
     # Check for simple color names
     if colormap_name in plt.colormaps():
         cmap = plt.get_cmap(colormap_name)
         if(cmap.N < num_colors):
-           return [cmap(i / cmap.N) for i in range(cmap.N)]
+           return tuple(cmap(i / cmap.N) for i in range(cmap.N))
         else:
-           return [cmap(i / num_colors) for i in range(num_colors)]
+           return tuple(cmap(i / num_colors) for i in range(num_colors))
     else:
         # Fallback to nice colors if colormap not found
-        return get_nice_colors()[:num_colors]                
+        return tuple(get_nice_colors()[:num_colors])
 
 def get_nice_colors() -> List[Tuple[float, float, float, float]]:
     # High saturation, print-friendly colors
@@ -539,8 +640,16 @@ class SurveyPlotter:
             'spine_color': "#4D4D4D",
             'font_size': 24,  # Base font size for matplotlib
             'label_font_size': 10,  # Font size for specific text labels
+            'rasterize_min_bars': 500,  # Charts with this many bars get them rasterized
         }
     
+    # Rasterize the bars of charts with so many of them that their paths dominate the PDF size
+    # and write time. Labels, ticks and legend stay vector. Survey charts stay well below this.
+    def _rasterize_heavy_bars(self, ax) -> None:
+        if len(ax.patches) >= self.chart_style['rasterize_min_bars']:
+            for patch in ax.patches:
+                patch.set_rasterized(True)
+    
     # Create a bar chart for a question's response distribution
     def create_bar_chart(self,
                         question: str,
@@ -580,7 +689,7 @@ class SurveyPlotter:
             display_values = values
             value_format = lambda x: str(int(x))
         
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = plt.subplots(figsize=figsize, layout='constrained')
         
         # Generate colors using colormap if specified, otherwise golden ratio system
         if color:
@@ -601,11 +710,8 @@ class SurveyPlotter:
             ax.set_xlim(0, max_value * 1.26)  # Add padding
             
             # Add value labels on bars
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                label_text = value_format(display_values[i])
-                ax.text(width + max_value * 0.01, bar.get_y() + bar.get_height()/2, 
-                    label_text, ha='left', va='center', fontsize=font_size)
+            ax.bar_label(bars, labels=[value_format(v) for v in display_values],
+                         padding=3, fontsize=font_size)
         else:
             bars = ax.bar(range(len(labels)), display_values, color=colors)
             ax.set_xticks(range(len(labels)))
@@ -616,11 +722,8 @@ class SurveyPlotter:
             ax.set_ylim(0, max_value * 1.18)  # Add 15% padding
             
             # Add value labels on bars
-            for i, bar in enumerate(bars):
-                height = bar.get_height()
-                label_text = value_format(display_values[i])
-                ax.text(bar.get_x() + bar.get_width()/2., height + max_value * 0.01,
-                    label_text, ha='center', va='bottom', fontsize=font_size)
+            ax.bar_label(bars, labels=[value_format(v) for v in display_values],
+                         padding=3, fontsize=font_size)
         
         
         # Customize spines to make frame thinner
@@ -628,8 +731,7 @@ class SurveyPlotter:
             spine.set_linewidth(self.chart_style['spine_linewidth'])
             spine.set_color(self.chart_style['spine_color'])
         
-        # Use tight_layout with padding to prevent label cutoff
-        plt.tight_layout()
+        self._rasterize_heavy_bars(ax)
         
         return fig
     
@@ -697,10 +799,8 @@ class SurveyPlotter:
             if original_filters:
                 self.analyzer.apply_filters()
         
-        # Find all unique options and preserve original survey order
-        all_options_set = set()
-        for _, counts in data_sets:
-            all_options_set.update(counts.keys())
+        # One row per option and one column per dataset, options a dataset lacks count 0
+        option_values = pd.concat([pd.Series(values_dict, dtype=float) for _, values_dict in data_sets], axis=1)
         
         # Get the original order from the survey schema and map them
         question_info = self.analyzer.get_question_info(question)
@@ -708,17 +808,8 @@ class SurveyPlotter:
         mapped_schema_options = [self.analyzer._get_mapped_option(o) for o in schema_options]
 
         # Preserve original schema order, then add any unexpected options at the end
-        all_options = []
-        processed_options = set()
-
-        for option in mapped_schema_options:
-            if option in all_options_set and option not in processed_options:
-                all_options.append(option)
-                processed_options.add(option)
-        
-        # Add any remaining options that weren't in the schema but are in the data
-        remaining_options = sorted([opt for opt in all_options_set if opt not in processed_options])
-        all_options.extend(remaining_options)
+        all_options = order_by_schema(option_values.index, mapped_schema_options)
+        option_values = option_values.reindex(all_options).fillna(0)
         
         # Apply label wrapping based on label_wrap_width setting
         wrapped_options = [wrap_label_smart(option, label_wrap_width) for option in all_options]
@@ -732,27 +823,17 @@ class SurveyPlotter:
         # Use provided colors or default to golden ratio color system for optimal visual separation
         colors = colors or self.role_colors
         
-        for i, (label, values_dict) in enumerate(data_sets):
-            values = [values_dict.get(option, 0) for option in all_options]
+        for i, label in enumerate(labels):
+            values = option_values.iloc[:, i].to_numpy()
             offset = height * (i - len(data_sets)/2 + 0.5)
             bars = ax.barh(y + offset, values, height, label=label, color=colors[i])
             
             # Add value labels on bars with consistent styling
-            for bar in bars:
-                width_val = bar.get_width()
-                if width_val >= 0:
-                    if show_percentages:
-                        label_text = f'{width_val:.1f}%'
-                    else:
-                        label_text = str(int(width_val))
-                    ax.text(width_val + max(values) * 0.01, bar.get_y() + bar.get_height()/2.,
-                           label_text, ha='left', va='center', fontsize=effective_font_size)
+            ax.bar_label(bars, fmt='{:.1f}%' if show_percentages else '%d',
+                         padding=3, fontsize=effective_font_size)
         
         # Find the maximum value across all datasets for proper axis scaling
-        all_values = []
-        for _, values_dict in data_sets:
-            all_values.extend(values_dict.values())
-        max_value = max(all_values) if all_values else 0
+        max_value = option_values.to_numpy().max() if option_values.size else 0
         
         # Set x-axis limits with extra space for percentage labels (20% padding)
         ax.set_xlim(0, max_value * 1.2)
@@ -770,6 +851,8 @@ class SurveyPlotter:
             spine.set_linewidth(self.chart_style['spine_linewidth'])
             spine.set_color(self.chart_style['spine_color'])
         
+        self._rasterize_heavy_bars(ax)
+        
         # Use tight_layout with padding to prevent label cutoff (consistent with other methods)
         # plt.tight_layout(pad=3.0)
         
@@ -799,48 +882,22 @@ class SurveyPlotter:
         schema_scale = question_info.get('scale', [])
         schema_items = question_info.get('items', [])
         
-        # Get all possible rating levels, preserving schema order
-        all_ratings_set = set()
-        for item_counts in matrix_counts.values():
-            all_ratings_set.update(item_counts.keys())
-        
-        # Preserve schema order for ratings
-        all_ratings = []
-        for rating in schema_scale:
-            if rating in all_ratings_set:
-                all_ratings.append(rating)
-                all_ratings_set.remove(rating)
-        # Add any unexpected ratings at the end
-        all_ratings.extend(sorted(all_ratings_set))
-        
-        # Get items preserving schema order
-        items_set = set(matrix_counts.keys())
-        items = []
-        for item in schema_items:
-            if item in items_set:
-                items.append(item)
-                items_set.remove(item)
-        # Add any unexpected items at the end
-        items.extend(sorted(items_set))
+        # Get all possible rating levels and the items, preserving schema order
+        # (unexpected ratings and items go at the end)
+        all_ratings = order_by_schema({rating for item_counts in matrix_counts.values() for rating in item_counts},
+                                      schema_scale)
+        items = order_by_schema(matrix_counts.keys(), schema_items)
         # Wrap item labels based on label_wrap_width setting (default to 25 if None)
         effective_width = label_wrap_width if label_wrap_width is not None else 25
         wrapped_items = [wrap_label_smart(item, effective_width) for item in items]
         
-        # Prepare data for stacked bar chart
-        data = {}
+        # Prepare data for stacked bar chart: one item x rating frame, missing pairs count as 0
+        data = pd.DataFrame.from_dict(matrix_counts, orient='index').reindex(
+            index=items, columns=all_ratings).fillna(0)
         if show_percentages:
             # Calculate total responses per item for percentage calculation
-            totals_per_item = [sum(matrix_counts[item].values()) for item in items]
-            for rating in all_ratings:
-                data[rating] = []
-                for i, item in enumerate(items):
-                    count = matrix_counts[item].get(rating, 0)
-                    total = totals_per_item[i] if totals_per_item[i] > 0 else 1  # Avoid division by zero
-                    percentage = (count / total) * 100
-                    data[rating].append(percentage)
-        else:
-            for rating in all_ratings:
-                data[rating] = [matrix_counts[item].get(rating, 0) for item in items]
+            totals_per_item = data.sum(axis=1).replace(0, 1)  # Avoid division by zero
+            data = data.div(totals_per_item, axis=0) * 100
         
         # Create the plot
         fig, ax = plt.subplots(figsize=figsize)
@@ -856,9 +913,10 @@ class SurveyPlotter:
         bottom = np.zeros(len(items))
         bars = []
         for i, rating in enumerate(all_ratings):
-            bars.append(ax.barh(wrapped_items, data[rating], left=bottom, 
+            values = data[rating].to_numpy()
+            bars.append(ax.barh(wrapped_items, values, left=bottom, 
                                label=rating, color=colors[i], height=0.78))
-            bottom += data[rating]
+            bottom += values
         
         # Customize the plot (remove axis labels as requested)
         # Rotate item labels if they're long
@@ -879,6 +937,8 @@ class SurveyPlotter:
             spine.set_linewidth(self.chart_style['spine_linewidth'])
             spine.set_color(self.chart_style['spine_color'])
         
+        self._rasterize_heavy_bars(ax)
+        
         return fig
     
     
@@ -913,7 +973,7 @@ class SurveyPlotter:
             rank_data[f'Rank {rank}'] = [positions.get(item, {}).get(rank, 0) for item in items]
         
         # Create the plot
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = plt.subplots(figsize=figsize, layout='constrained')
         
         # Generate colors using colormap if specified, otherwise golden ratio system
         if color:
@@ -962,7 +1022,7 @@ class SurveyPlotter:
             spine.set_linewidth(self.chart_style['spine_linewidth'])
             spine.set_color(self.chart_style['spine_color'])
         
-        plt.tight_layout()
+        self._rasterize_heavy_bars(ax)
         
         return fig
 
@@ -1033,7 +1093,7 @@ class SurveyPlotter:
         wrapped_main_categories = [wrap_label_smart(cat, label_wrap_width) for cat in main_categories]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = plt.subplots(figsize=figsize, layout='constrained')
         
         # Create horizontal stacked bars
         left = np.zeros(len(main_categories))
@@ -1070,8 +1130,8 @@ class SurveyPlotter:
             spine.set_linewidth(self.chart_style['spine_linewidth'])
             spine.set_color(self.chart_style['spine_color'])
         
-        plt.tight_layout()
-                
+        self._rasterize_heavy_bars(ax)
+        
         return fig
 
 if __name__ == "__main__":
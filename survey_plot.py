@@ -2,6 +2,10 @@
 Survey Plot Generator
 """
 
+import matplotlib
+# Plots are only ever written to files, so use Agg instead of probing for and starting a GUI backend
+matplotlib.use('Agg')
+
 from survey_analyzer import SurveyAnalyzer, SurveyPlotter, wrap_label_smart, font_size
 import matplotlib.pyplot as plt
 import matplotlib.backends.backend_pdf as pdf_backend
@@ -390,9 +394,10 @@ def plot_role_per_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
         # Default: normalize by role population size
         # Percentage of respondents within each role who selected the task
         role_totals = analyzer.get_question_counts('professional_role', filtered=False)
+        role_sizes = {role: max(role_totals.get(role, 0), 1) for role in roles}
         role_task_percent = {
             role: [
-                (role_task_counts[role][j] / max(role_totals.get(role, 0), 1) * 100)
+                (role_task_counts[role][j] / role_sizes[role] * 100)
                 for j in range(len(mapped_tasks))
             ]
             for role in roles
@@ -406,7 +411,7 @@ def plot_role_per_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
     chart_size = (12.0, chart_size[1])
 
     # Plot stacked horizontal bars
-    fig, ax = plt.subplots(figsize=chart_size)
+    fig, ax = plt.subplots(figsize=chart_size, layout='constrained')
     # Increase axis tick label sizes slightly (+2pt)
     ax.tick_params(axis='y', labelsize=font_size)
     ax.tick_params(axis='x', labelsize=(font_size - 5))
@@ -433,8 +438,6 @@ def plot_role_per_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
     # Place legend inside bottom-right where there's room
     ax.legend(loc='lower right', fontsize=20, ncol=2)
 
-    plt.tight_layout()
-
     pdf_path = os.path.join(output_dir, f"q5_role_per_usage.pdf")
     fig.savefig(pdf_path)
     plt.close(fig)
@@ -566,7 +569,7 @@ def plot_role_vs_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output_
     chart_size = (chart_size[0], chart_size[1] * 1.5)  # Add extra height for comparison
     
     # Create figure
-    fig, ax = plt.subplots(figsize=chart_size)
+    fig, ax = plt.subplots(figsize=chart_size, layout='constrained')
     
     # Plot settings
     y = list(range(len(mapped_tasks)))
@@ -578,6 +581,8 @@ def plot_role_vs_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output_
         for task_idx, task in enumerate(mapped_tasks):
             total = sum(role_data[task] for role_data in group_data.values())
             max_value = max(max_value, total)
+    # Gap between a stacked bar and its total label, the same for every bar
+    label_offset = max_value * 0.01
     
     # Track legend handles to avoid duplicates
     legend_handles = {}
@@ -609,7 +614,7 @@ def plot_role_vs_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output_
         for bar_idx, total_val in enumerate(left):
             if total_val > 0:
                 label_text = f'{total_val:.1f}%'
-                ax.text(total_val + (max_value * 0.01), bar_idx + offset,
+                ax.text(total_val + label_offset, bar_idx + offset,
                        label_text, ha='left', va='center', fontsize=font_size)
     
     # Styling
@@ -632,8 +637,6 @@ def plot_role_vs_usage(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output_
     for spine in ax.spines.values():
         spine.set_linewidth(0.5)
     
-    plt.tight_layout()
-    
     # Generate filename with mode suffix
     suffix = "" if per_group else "_total"
     pdf_path = os.path.join(output_dir, f"q5_role_vs_usage{suffix}.pdf")
@@ -715,7 +718,7 @@ def plot_role_vs_usage_3(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, outpu
     chart_size = (chart_size[0], chart_size[1] * 1.6)  # Add extra height for comparison
     
     # Create figure
-    fig, ax = plt.subplots(figsize=chart_size)
+    fig, ax = plt.subplots(figsize=chart_size, layout='constrained')
     
     # Plot settings
     y = list(range(len(mapped_tasks)))
@@ -728,13 +731,9 @@ def plot_role_vs_usage_3(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, outpu
         offset = height * (i - len(group_labels)/2 + 0.5)
         bars = ax.barh([pos + offset for pos in y], values, height, label=label, color=color)
         
-        # Add percentage labels on bars
-        for bar in bars:
-            width_val = bar.get_width()
-            if width_val > 0:
-                label_text = f'{width_val:.1f}%'
-                ax.text(width_val + 1, bar.get_y() + bar.get_height()/2.,
-                       label_text, ha='left', va='center', fontsize=font_size)
+        # Add percentage labels on bars (empty bars stay unlabeled)
+        ax.bar_label(bars, labels=[f'{v:.1f}%' if v > 0 else '' for v in values],
+                     padding=3, fontsize=font_size)
     
     # Find max value for axis scaling
     max_value = max(max(d.values()) for d in data_sets) if data_sets else 0
@@ -754,8 +753,6 @@ def plot_role_vs_usage_3(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, outpu
     for spine in ax.spines.values():
         spine.set_linewidth(0.5)
     
-    plt.tight_layout()
-    
     pdf_path = os.path.join(output_dir, f"q5_role_vs_usage_3.pdf")
     fig.savefig(pdf_path)
     plt.close(fig)
@@ -892,7 +889,7 @@ def plot_level_generation_frequency_comparison(analyzer: SurveyAnalyzer, plotter
     chart_size = (chart_size[0], chart_size[1] * 1.3)  # Add extra height for comparison
     
     # Create figure
-    fig, ax = plt.subplots(figsize=chart_size)
+    fig, ax = plt.subplots(figsize=chart_size, layout='constrained')
     
     # Plot settings
     y = list(range(len(mapped_options)))
@@ -904,6 +901,8 @@ def plot_level_generation_frequency_comparison(analyzer: SurveyAnalyzer, plotter
         for option_idx, option in enumerate(mapped_options):
             total = sum(role_data[option] for role_data in group_data.values())
             max_value = max(max_value, total)
+    # Gap between a stacked bar and its total label, the same for every bar
+    label_offset = max_value * 0.01
     
     # Track legend handles to avoid duplicates
     legend_handles = {}
@@ -935,7 +934,7 @@ def plot_level_generation_frequency_comparison(analyzer: SurveyAnalyzer, plotter
         for bar_idx, total_val in enumerate(left):
             if total_val > 0:
                 label_text = f'{total_val:.1f}%'
-                ax.text(total_val + (max_value * 0.01), bar_idx + offset,
+                ax.text(total_val + label_offset, bar_idx + offset,
                        label_text, ha='left', va='center', fontsize=font_size)
     
     # Styling
@@ -977,8 +976,6 @@ def plot_level_generation_frequency_comparison(analyzer: SurveyAnalyzer, plotter
     ax2.set_yticklabels(norm_labels, fontsize=font_size)
     ax2.set_ylabel('Assigned Value (0-1)', fontsize=font_size)
     
-    plt.tight_layout()
-    
     pdf_path = os.path.join(output_dir, f"q6_comparison_{question_key}.pdf")
     fig.savefig(pdf_path)
     plt.close(fig)
@@ -1543,28 +1540,24 @@ def plot_ai_conclusions(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
         df = analyzer.get_filtered_dataframe()
         if question_key not in df.columns:
             return 0.0
-        series = df[question_key].dropna()
-        if series.empty:
+        series = df[question_key]
+        # Respondents who answered at all; count() skips missing answers without copying the column
+        total = int(series.count())
+        if total == 0:
             return 0.0
-        total = len(series)
         # Work with mapped target set (target_set is expected to already
         # contain mapped labels above). Defensive: map any remaining
         # non-mapped elements too.
         mapped_target = set(map(map_opt, target_set))
 
-        hit = 0
-        for val in series:
-            # Normalize to iterable of strings
-            if isinstance(val, list):
-                items = [map_opt(v) for v in val]
-            elif isinstance(val, str):
-                items = [map_opt(val)]
-            else:
-                # Unexpected type (e.g., dict for matrix) – treat as no hit
-                items = []
-            if any(item in mapped_target for item in items):
-                hit += 1
-        return (hit / total) * 100.0 if total > 0 else 0.0
+        # Normalize to one string per row entry: lists are exploded, plain strings kept.
+        # Dicts (matrix answers) are dropped first, explode would turn them into their keys;
+        # they, empty lists and missing answers are treated as no hit.
+        answers = series[series.map(type).ne(dict)].explode()
+        answers = answers[answers.map(type).eq(str)]
+        hits = answers.map(map_opt).isin(mapped_target)
+        hit = int(hits.groupby(level=0).any().sum())
+        return (hit / total) * 100.0
 
     p17_ctrl = percent_selecting_any('ai_role_preference', q17_control)
     p17_auto = percent_selecting_any('ai_role_preference', q17_automation)
@@ -1585,7 +1578,7 @@ def plot_ai_conclusions(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
     automation_vals = [p17_auto, p18_auto, p19_auto]
 
     # Figure sizing and style consistent with other figures (wider to fit legend)
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
 
     y = np.arange(len(contexts))
     height = 0.44  # Bar height for each group (tight, no overlap)
@@ -1611,15 +1604,9 @@ def plot_ai_conclusions(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
     ax.axvline(50, color='#888888', linewidth=1, linestyle='--', alpha=0.7)
 
     # Add bar labels to the right end of bars
-    def add_labels_h(bars):
-        for b in bars:
-            width_val = b.get_width()
-            if width_val > 0:
-                ax.text(width_val + 1, b.get_y() + b.get_height()/2,
-                        f"{width_val:.1f}%", ha='left', va='center', fontsize=font_size)
-
-    add_labels_h(bars1)
-    add_labels_h(bars2)
+    for bars, vals in ((bars1, control_vals), (bars2, automation_vals)):
+        ax.bar_label(bars, labels=[f"{v:.1f}%" if v > 0 else '' for v in vals],
+                     padding=3, fontsize=font_size)
 
     # Legend and spines consistent with plotter style
     # Place legend centered below the chart
@@ -1628,8 +1615,6 @@ def plot_ai_conclusions(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
         spine.set_linewidth(plotter.chart_style['spine_linewidth'])
         spine.set_color(plotter.chart_style['spine_color'])
 
-    plt.tight_layout()
-
     pdf_path = os.path.join(output_dir, f"c2_ai_conclusions.pdf")
     fig.savefig(pdf_path)
     plt.close(fig)
@@ -1637,6 +1622,13 @@ def plot_ai_conclusions(analyzer: SurveyAnalyzer, plotter: SurveyPlotter, output
     print(f"  Saved as: {pdf_path}")
     return pdf_path
 
+# Run one plot function, used as the task of the plotting worker processes.
+# Each task gets its own pickled copy of the analyzer, so the filters set by one plot
+# never leak into a plot drawn at the same time.
+def run_plot(task: Tuple) -> str:
+    plot_func, analyzer, plotter, output_dir = task
+    return plot_func(analyzer, plotter, output_dir)
+
 # Generate plots for all 20 survey questions.
 def main() -> None:
     
@@ -1646,6 +1638,9 @@ def main() -> None:
     questions_to_plot = [5,6]
     # questions_to_plot = list(range(1, 22))  # Plot all questions by default
     
+    # Number of worker processes drawing plots at the same time (1 draws them one by one)
+    plot_workers = os.cpu_count() or 1
+    
     # Create output directory
     output_dir = "plots"
     os.makedirs(output_dir, exist_ok=True)
@@ -1686,11 +1681,18 @@ def main() -> None:
     }
     
     # Generate plots for selected questions
-    for question in sorted(set(questions_to_plot)):  # Use set to remove duplicates
-        if question in plot_functions:
-            for plot_func in plot_functions[question]:
-                pdf_path = plot_func(analyzer, plotter, output_dir)
-                created_files.append(pdf_path)
+    tasks = [(plot_func, analyzer, plotter, output_dir)
+             for question in sorted(set(questions_to_plot))  # Use set to remove duplicates
+             if question in plot_functions
+             for plot_func in plot_functions[question]]
+    
+    # The plots share no state, so they can be drawn in parallel (progress output may interleave)
+    if plot_workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(plot_workers, len(tasks))) as executor:
+            created_files.extend(executor.map(run_plot, tasks))
+    else:
+        created_files.extend(run_plot(task) for task in tasks)
     
     # Summary
     print("=== Summary ===")